@@ -0,0 +1,15 @@
+"""Gunicorn settings for the Azure Pricing Assistant web app.
+
+Chat turns and proposal streams spend nearly all their time waiting on Azure AI
+and MCP calls, and each open SSE stream holds a worker thread, so workers run a
+generous thread pool. Both values can be tuned per deployment.
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", "4"))
+threads = int(os.getenv("APP_THREAD_LIMIT", "32"))
+timeout = 120
+accesslog = "-"
+errorlog = "-"
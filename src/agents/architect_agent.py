@@ -18,6 +18,8 @@ from src.shared.service_catalog import (
 # Get logger (setup handled by application entry point)
 logger = logging.getLogger(__name__)
 
+_IDENTIFIED_SERVICES_PATTERN = re.compile(r'"identified_services"\s*:\s*\[(.*?)\]', flags=re.DOTALL)
+
 
 def extract_partial_bom_from_response(response: str) -> List[Dict[str, Any]]:
     """
@@ -31,8 +33,7 @@ def extract_partial_bom_from_response(response: str) -> List[Dict[str, Any]]:
     """
     try:
         # Look for identified_services JSON block
-        pattern = r'"identified_services"\s*:\s*\[(.*?)\]'
-        match = re.search(pattern, response, re.DOTALL)
+        match = _IDENTIFIED_SERVICES_PATTERN.search(response)
 
         if match:
             services_json = f"[{match.group(1)}]"
@@ -5,6 +5,7 @@ import logging
 import os
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List
 
 from agent_framework import ChatAgent
@@ -16,6 +17,8 @@ from src.shared.pricing_calculator import get_calculator_instructions_for_agent
 # Configure logging
 logger = logging.getLogger(__name__)
 
+_ISO_DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
 
 def extract_json_from_response(response: str) -> str:
     """
@@ -146,7 +149,7 @@ def validate_pricing_result(data: Any) -> None:
     if not isinstance(pricing_date, str):
         raise ValueError("pricing_date must be a string")
 
-    if not re.match(r"^\d{4}-\d{2}-\d{2}$", pricing_date):
+    if not _ISO_DATE_PATTERN.match(pricing_date):
         raise ValueError(f"pricing_date must be ISO 8601 format (YYYY-MM-DD), got: {pricing_date}")
 
     # Validate optional fields
@@ -233,20 +236,20 @@ async def calculate_incremental_pricing(
 
     # Build prompt with BOM items
     bom_json = json.dumps(bom_items, indent=2)
-    prompt = f"""Calculate pricing for the following BOM items:
-
-{bom_json}
+    # Keep the fixed wording ahead of the BOM so the cacheable prefix is as long as possible
+    prompt = f"""Calculate pricing for the following BOM items. Return pricing in the required JSON format with items, total_monthly, currency, and pricing_date.
 
-Return pricing in the required JSON format with items, total_monthly, currency, and pricing_date."""
+{bom_json}"""
 
     try:
         # Get new thread and run pricing
         thread = pricing_agent.get_new_thread()
-        response_text = ""
+        response_parts = []
 
         async for message in pricing_agent.run_stream(user_message=prompt, thread=thread):
             if hasattr(message, "data") and hasattr(message.data, "text"):
-                response_text += message.data.text
+                response_parts.append(message.data.text)
+        response_text = "".join(response_parts)
 
         logger.info(f"Incremental pricing response length: {len(response_text)}")
 
@@ -274,9 +277,14 @@ Return pricing in the required JSON format with items, total_monthly, currency,
         }
 
 
-def create_pricing_agent(client: AzureAIAgentClient) -> ChatAgent:
-    """Create Pricing Agent with Playwright MCP for Azure Pricing Calculator automation."""
+@lru_cache(maxsize=None)
+def _pricing_instructions() -> str:
+    """Build the pricing agent's system prompt.
 
+    The prompt is fully static, so it is built once and reused. Every pricing
+    run then sends a byte-identical prefix, which the service can serve from
+    its prompt cache instead of re-processing it.
+    """
     # Get calculator automation instructions
     calculator_instructions = get_calculator_instructions_for_agent()
 
@@ -396,13 +404,18 @@ LOGGING:
 - Log failures: "[ERROR] Failed to price {{serviceName}} {{sku}}: {{error}}"
 - Final summary: "[INFO] Pricing complete: {{count}} items, ${{total}}/mo, {{error_count}} errors"
 """
+    return instructions
+
+
+def create_pricing_agent(client: AzureAIAgentClient) -> ChatAgent:
+    """Create Pricing Agent with Playwright MCP for Azure Pricing Calculator automation."""
 
     # Create Playwright MCP tool
     playwright_tool = create_playwright_mcp_tool(client=client)
 
     agent = ChatAgent(
         chat_client=client,
-        instructions=instructions,
+        instructions=_pricing_instructions(),
         name="pricing_agent",
         tools=[playwright_tool],
     )
@@ -53,8 +53,14 @@ async def run_cli_workflow() -> None:
     print_workflow_start()
 
     interface = CLIInterface()
-    session_id = "cli-session"
 
+    # Keep one Azure AI client open for every turn instead of one per call.
+    async with interface.context:
+        await _run_cli_session(interface, "cli-session")
+
+
+async def _run_cli_session(interface: CLIInterface, session_id: str) -> None:
+    """Drive the chat and proposal loop for a single CLI session."""
     # Initial greeting
     greeting = "Hello!\nI'm here to help you price an Azure solution. You can start by telling me the requirements, or give me a transcript from a customer meeting."
     first_turn = await interface.chat_turn(session_id, greeting)
@@ -101,8 +101,7 @@ class CLIInterface(PricingInterface):
         Returns:
             List of chat messages
         """
-        history_dict = self.handler.get_session_history(self.context, session_id)
-        return history_dict.get("history", [])
+        return self.handler.get_session_history_list(self.context, session_id)
 
     def get_stored_proposal(self, session_id: str) -> Dict[str, Any]:
         """
@@ -57,6 +57,17 @@ def get_flask_secret() -> str:
     return secret
 
 
+def get_memcached_servers() -> list:
+    """
+    Return Memcached servers used for shared session storage.
+
+    Reads a comma-separated "host:port" list from MEMCACHED_SERVERS. An empty list
+    means sessions stay in process memory.
+    """
+    servers = os.getenv("MEMCACHED_SERVERS", "")
+    return [server.strip() for server in servers.split(",") if server.strip()]
+
+
 def get_port(default: int = 8000) -> int:
     """Return the desired port for local hosting."""
     try:
@@ -73,6 +73,7 @@ class SessionData:
     thread: Any
     history: List[dict]
     turn_count: int = 0  # Track conversation turns for 20-turn limit
+    history_version: int = 0  # Bumped whenever history or BOM items change
     bom_items: List[Dict[str, Any]] = None  # BOM items built by Architect Agent during conversation
     proposal: Optional[ProposalBundle] = None  # Stored proposal after generation
     
@@ -83,7 +84,7 @@ class SessionData:
     pricing_date: Optional[str] = None  # ISO 8601 date of last pricing update
     pricing_task_status: str = "idle"  # Values: idle, queued, processing, complete, error
     pricing_task_error: Optional[str] = None  # Error message from failed pricing updates
-    pricing_last_update: Optional[datetime] = None  # Last pricing modification timestamp
+    pricing_last_update: Optional[datetime] = None  # Last pricing modification timestamp (UTC)
     pricing_task_handle: Optional[asyncio.Task] = None  # Task reference for cancellation
 
     def __post_init__(self):
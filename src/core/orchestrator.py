@@ -5,7 +5,7 @@ import json
 import logging
 import re
 import traceback
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
 from opentelemetry.trace import SpanKind
@@ -29,6 +29,20 @@ from .session import InMemorySessionStore
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Upper bound on a single background pricing run
+PRICING_TASK_TIMEOUT_SECONDS = 30.0
+
+# Pricing states whose results (current or pending) still match the session BOM
+_PRICING_CURRENT_STATUSES = frozenset({"queued", "processing", "complete"})
+
+_JSON_FENCE_OBJECT_PATTERN = re.compile(r"```json\s*(\{.*?\})\s*```", flags=re.DOTALL)
+# Tried in order by _extract_json_object
+_JSON_OBJECT_PATTERNS = (
+    _JSON_FENCE_OBJECT_PATTERN,
+    re.compile(r"```\s*(\{.*?\})\s*```", flags=re.DOTALL),
+    re.compile(r"(\{.*\})", flags=re.DOTALL),
+)
+
 
 def _stage_span(stage_name: str, *, session_id: Optional[str] = None, **attrs: Any):
     """Create a traced span for a workflow stage with shared attributes."""
@@ -95,8 +109,18 @@ async def _run_pricing_task_background(
         session_id: Session identifier
     """
     from src.agents.pricing_agent import calculate_incremental_pricing
-    
-    session_data = session_store.get(session_id)
+
+    # Session writes go through update() so a chat turn saved by another worker
+    # while pricing runs is not overwritten by this task's stale copy.
+    def _start(data: SessionData) -> None:
+        if data.bom_items:
+            # Transition to processing state
+            data.pricing_task_status = "processing"
+            data.pricing_task_error = None
+        else:
+            data.pricing_task_status = "idle"
+
+    session_data = session_store.update(session_id, _start)
     if not session_data:
         logger.warning(f"No session data found for {session_id} in pricing background task")
         return
@@ -104,56 +128,48 @@ async def _run_pricing_task_background(
     # Only price if we have BOM items
     if not session_data.bom_items:
         logger.info(f"No BOM items to price for session {session_id}")
-        session_data.pricing_task_status = "idle"
-        session_store.set(session_id, session_data)
         return
     
-    # Transition to processing state
-    session_data.pricing_task_status = "processing"
-    session_data.pricing_task_error = None
-    session_store.set(session_id, session_data)
-    
     try:
-        # Run pricing calculation with 30s timeout
         pricing_result = await asyncio.wait_for(
             calculate_incremental_pricing(client, session_data.bom_items),
-            timeout=30.0
+            timeout=PRICING_TASK_TIMEOUT_SECONDS
         )
         
+        # Log any errors from pricing
+        errors = pricing_result.get("errors", [])
+        if errors:
+            logger.warning(f"Pricing errors for session {session_id}: {errors}")
+
+        def _apply_result(data: SessionData) -> None:
+            data.pricing_items = pricing_result.get("pricing_items", [])
+            data.pricing_total = pricing_result.get("total_monthly", 0.0)
+            data.pricing_currency = pricing_result.get("currency", "USD")
+            data.pricing_date = pricing_result.get("pricing_date")
+            data.pricing_task_status = "complete"
+            # Aware UTC so the web Last-Modified header is correct on any host
+            data.pricing_last_update = datetime.now(timezone.utc)
+            if errors:
+                data.pricing_task_error = "; ".join(errors[:3])  # Show first 3 errors
+
         # Update session with pricing results
-        session_data = session_store.get(session_id)
+        session_data = session_store.update(session_id, _apply_result)
         if session_data:
-            session_data.pricing_items = pricing_result.get("pricing_items", [])
-            session_data.pricing_total = pricing_result.get("total_monthly", 0.0)
-            session_data.pricing_currency = pricing_result.get("currency", "USD")
-            session_data.pricing_date = pricing_result.get("pricing_date")
-            session_data.pricing_task_status = "complete"
-            session_data.pricing_last_update = datetime.now()
-            
-            # Log any errors from pricing
-            errors = pricing_result.get("errors", [])
-            if errors:
-                logger.warning(f"Pricing errors for session {session_id}: {errors}")
-                session_data.pricing_task_error = "; ".join(errors[:3])  # Show first 3 errors
-            
-            session_store.set(session_id, session_data)
             logger.info(f"Pricing task complete for session {session_id}: ${session_data.pricing_total:.2f}")
     
     except asyncio.TimeoutError:
         logger.error(f"Pricing task timeout for session {session_id}", exc_info=True)
         increment_errors("pricing_timeout", session_id=session_id)
-        session_data = session_store.get(session_id)
-        if session_data:
-            session_data.pricing_task_status = "error"
-            session_data.pricing_task_error = "Pricing calculation timed out after 30 seconds"
-            session_store.set(session_id, session_data)
+        _set_pricing_status(
+            session_store,
+            session_id,
+            "error",
+            f"Pricing calculation timed out after {PRICING_TASK_TIMEOUT_SECONDS:g} seconds",
+        )
     
     except asyncio.CancelledError:
         logger.info(f"Pricing task cancelled for session {session_id}")
-        session_data = session_store.get(session_id)
-        if session_data:
-            session_data.pricing_task_status = "idle"
-            session_store.set(session_id, session_data)
+        _set_pricing_status(session_store, session_id, "idle")
         raise
     
     except Exception as e:
@@ -166,12 +182,26 @@ async def _run_pricing_task_background(
         )
         increment_errors("pricing_task_failure", session_id=session_id)
         
-        session_data = session_store.get(session_id)
-        if session_data:
-            session_data.pricing_task_status = "error"
-            # Sanitize error message for UI (no traceback)
-            session_data.pricing_task_error = f"Pricing calculation failed: {str(e)}"
-            session_store.set(session_id, session_data)
+        # Sanitize error message for UI (no traceback)
+        _set_pricing_status(
+            session_store, session_id, "error", f"Pricing calculation failed: {str(e)}"
+        )
+
+
+def _set_pricing_status(
+    session_store: InMemorySessionStore,
+    session_id: str,
+    status: str,
+    error: Optional[str] = None,
+) -> None:
+    """Record a pricing task state change on the stored session, if it still exists."""
+
+    def _apply(data: SessionData) -> None:
+        data.pricing_task_status = status
+        if error is not None:
+            data.pricing_task_error = error
+
+    session_store.update(session_id, _apply)
 
 
 async def run_question_turn(
@@ -193,6 +223,24 @@ async def run_question_turn(
     Returns:
         Dict with response, is_done, requirements_summary, history, and bom_items
     """
+    result, _ = await run_question_turn_with_session(
+        client, session_store, session_id, user_message
+    )
+    return result
+
+
+async def run_question_turn_with_session(
+    client: AzureAIAgentClient,
+    session_store: InMemorySessionStore,
+    session_id: str,
+    user_message: str,
+) -> Tuple[Dict[str, Any], SessionData]:
+    """Run a single architect-agent turn (see run_question_turn).
+
+    Returns:
+        Tuple of the turn result dict and the SessionData it persisted, so callers
+        can reuse the session without another store read
+    """
     with _stage_span(
         "Gathering requirements",
         session_id=session_id,
@@ -201,7 +249,8 @@ async def run_question_turn(
         architect_agent = create_architect_agent(client)
 
         session_data = session_store.get(session_id)
-        if not session_data:
+        is_new_session = session_data is None
+        if is_new_session:
             thread = architect_agent.get_new_thread()
             session_data = SessionData(thread=thread, history=[])
         else:
@@ -214,46 +263,76 @@ async def run_question_turn(
                 "Please generate a proposal to continue with cost analysis."
             )
 
-        response_text = ""
+        response_parts: List[str] = []
         async for update in architect_agent.run_stream(user_message, thread=thread):
             if update.text:
-                response_text += update.text
-
-        session_data.history.append({"role": "user", "content": user_message})
-        session_data.history.append({"role": "assistant", "content": response_text})
-
-        # Increment turn counter after successful run
-        session_data.turn_count += 1
+                response_parts.append(update.text)
+        response_text = "".join(response_parts)
 
         # Extract partial BOM items from architect response
         partial_bom = extract_partial_bom_from_response(response_text)
-        bom_updated = False
+        bom_updated = bool(partial_bom)
+        start_pricing = False
+        superseded_task = None
+
+        def _apply_turn(data: SessionData) -> None:
+            # Applied to the freshest stored copy, so writes made by other workers
+            # while the agent ran (pricing results, resets) are kept
+            nonlocal start_pricing, superseded_task
+            data.thread = thread
+            data.history.append({"role": "user", "content": user_message})
+            data.history.append({"role": "assistant", "content": response_text})
+
+            # Increment turn counter after successful run
+            data.turn_count += 1
+
+            start_pricing = False
+            if partial_bom:
+                # Merge with existing BOM items
+                existing_bom = data.bom_items or []
+                data.bom_items = _merge_bom_items(existing_bom, partial_bom)
+
+                # Trigger pricing calculation in background when BOM is updated; an
+                # unchanged BOM keeps the pricing already computed or in flight for it
+                bom_changed = data.bom_items != existing_bom
+                if data.bom_items and (
+                    bom_changed or data.pricing_task_status not in _PRICING_CURRENT_STATUSES
+                ):
+                    superseded_task = data.pricing_task_handle
+                    data.pricing_task_status = "queued"
+                    data.pricing_task_error = None
+                    start_pricing = True
+
+            # Bump the version only once history and BOM both reflect this turn, so a
+            # poll that reads the live session mid-turn cannot cache a stale BOM as current
+            data.history_version += 1
+
+        if is_new_session:
+            _apply_turn(session_data)
+            session_store.set(session_id, session_data)
+        else:
+            stored = session_store.update(session_id, _apply_turn)
+            if stored is None:
+                # Reset (or deleted) while the agent ran; do not bring the session back
+                logger.info(f"Session {session_id} was removed during the turn; not saving it")
+                start_pricing = False
+                _apply_turn(session_data)
+            else:
+                session_data = stored
+
         if partial_bom:
-            # Merge with existing BOM items
-            existing_bom = session_data.bom_items or []
-            session_data.bom_items = _merge_bom_items(existing_bom, partial_bom)
-            bom_updated = True
             logger.info(f"Architect identified {len(partial_bom)} new/updated BOM items, total: {len(session_data.bom_items)}")
-            
-            # Trigger pricing calculation in background when BOM is updated
-            if session_data.bom_items:
-                # Cancel any existing pricing task
-                if session_data.pricing_task_handle and not session_data.pricing_task_handle.done():
-                    session_data.pricing_task_handle.cancel()
-                
-                # Queue pricing task
-                session_data.pricing_task_status = "queued"
-                session_data.pricing_task_error = None
-                session_store.set(session_id, session_data)
-                
-                # Start pricing task in background
-                pricing_task = asyncio.create_task(
-                    _run_pricing_task_background(client, session_store, session_id)
-                )
-                session_data.pricing_task_handle = pricing_task
-                logger.info(f"Started background pricing task for session {session_id}")
-        
-        session_store.set(session_id, session_data)
+
+        if start_pricing:
+            # Cancel any existing pricing task
+            if superseded_task and not superseded_task.done():
+                superseded_task.cancel()
+
+            # Start pricing task in background
+            session_data.pricing_task_handle = asyncio.create_task(
+                _run_pricing_task_background(client, session_store, session_id)
+            )
+            logger.info(f"Started background pricing task for session {session_id}")
 
         is_done, requirements_summary = parse_question_completion(response_text)
 
@@ -266,7 +345,7 @@ async def run_question_turn(
             "bom_updated": bom_updated,
         }
 
-        return result
+        return result, session_data
 
 
 def history_to_requirements(history: List[Dict[str, str]]) -> str:
@@ -305,8 +384,8 @@ async def run_bom_pricing_proposal(
     workflow = SequentialBuilder().participants([pricing_agent, proposal_agent]).build()
 
     bom_text = json.dumps(bom_items or [], indent=2)
-    pricing_output = ""
-    proposal_output = ""
+    pricing_parts: List[str] = []
+    proposal_parts: List[str] = []
     current_agent = ""
 
     cm = _stage_span("Preparing pricing", requirements_length=len(requirements_text or ""))
@@ -332,12 +411,15 @@ async def run_bom_pricing_proposal(
                     continue
 
                 if current_agent == "pricing_agent":
-                    pricing_output += text
+                    pricing_parts.append(text)
                 elif current_agent == "proposal_agent":
-                    proposal_output += text
+                    proposal_parts.append(text)
     finally:
         cm.__exit__(None, None, None)
 
+    pricing_output = "".join(pricing_parts)
+    proposal_output = "".join(proposal_parts)
+
     # Parse and validate pricing output
     try:
         pricing_result = parse_pricing_response(pricing_output)
@@ -395,8 +477,8 @@ async def run_bom_pricing_proposal_stream(
     workflow = SequentialBuilder().participants([pricing_agent, proposal_agent]).build()
 
     bom_text = json.dumps(bom_items or [], indent=2)
-    pricing_output = ""
-    proposal_output = ""
+    pricing_parts: List[str] = []
+    proposal_parts: List[str] = []
     current_agent = ""
 
     cm = _stage_span("Preparing pricing", requirements_length=len(requirements_text or ""))
@@ -432,15 +514,18 @@ async def run_bom_pricing_proposal_stream(
 
                 # Accumulate output for each agent
                 if current_agent == "pricing_agent":
-                    pricing_output += text
+                    pricing_parts.append(text)
                 elif current_agent == "proposal_agent":
-                    proposal_output += text
+                    proposal_parts.append(text)
 
                 # Yield progress event with text chunk
                 yield ProgressEvent(
                     event_type="agent_progress", agent_name=current_agent, message=text
                 )
 
+        pricing_output = "".join(pricing_parts)
+        proposal_output = "".join(proposal_parts)
+
         # Validate pricing output
         pricing_result = parse_pricing_response(pricing_output)
         if pricing_result and pricing_result.get("items"):
@@ -532,8 +617,7 @@ def _extract_json_from_code_block(text: str) -> Optional[Any]:
     Returns None if no code block found, so fallback logic can try other formats.
     """
     # Try ```json code block first (preferred format)
-    pattern = r"```json\s*(\{.*?\})\s*```"
-    match = re.search(pattern, text, flags=re.DOTALL)
+    match = _JSON_FENCE_OBJECT_PATTERN.search(text)
 
     if match:
         candidate = match.group(1)
@@ -549,14 +633,8 @@ def _extract_json_from_code_block(text: str) -> Optional[Any]:
 def _extract_json_object(text: str) -> Optional[Any]:
     """Extract a JSON object from plain text or fenced code blocks."""
 
-    patterns = [
-        r"```json\s*(\{.*?\})\s*```",
-        r"```\s*(\{.*?\})\s*```",
-        r"(\{.*\})",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text, flags=re.DOTALL)
+    for pattern in _JSON_OBJECT_PATTERNS:
+        match = pattern.search(text)
         if not match:
             continue
         candidate = match.group(1)
@@ -1,38 +1,269 @@
 """Session storage abstractions for chat threads."""
 
-from typing import Dict, Optional
+import dataclasses
+import logging
+import pickle
+import threading
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
+from .config import get_memcached_servers
 from .models import SessionData
 
+try:
+    from pymemcache.client.hash import HashClient
+except Exception:  # pragma: no cover - optional dependency
+    HashClient = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SHARD_COUNT = 16
+DEFAULT_SESSION_TTL_SECONDS = 24 * 60 * 60
+_PROPOSAL_INDEX_KEY = "__proposal_index__"
+_INDEX_CAS_RETRIES = 5
+_SESSION_CAS_RETRIES = 5
+
 
 class InMemorySessionStore:
-    """Lightweight in-memory session store (dev use only)."""
+    """Lightweight in-memory session store (dev use only).
+
+    Sessions are spread across independently locked shards so concurrent
+    requests for different sessions do not contend on a single lock. Each
+    shard also indexes the ids of sessions stored with a proposal, so listing
+    proposals does not scan every session.
+    """
 
-    def __init__(self) -> None:
-        """Initialize the in-memory session dictionary."""
-        self._sessions: Dict[str, SessionData] = {}
+    def __init__(self, shard_count: int = DEFAULT_SHARD_COUNT) -> None:
+        """Initialize the sharded in-memory session dictionaries."""
+        self._shards: List[Dict[str, SessionData]] = [{} for _ in range(shard_count)]
+        self._proposal_ids: List[Set[str]] = [set() for _ in range(shard_count)]
+        self._locks: List[threading.Lock] = [threading.Lock() for _ in range(shard_count)]
+
+    def _index(self, session_id: str) -> int:
+        """Return the shard index that owns a session id."""
+        return hash(session_id) % len(self._shards)
 
     def get(self, session_id: str) -> Optional[SessionData]:
         """Return session data for a session id, if present."""
-        return self._sessions.get(session_id)
+        index = self._index(session_id)
+        with self._locks[index]:
+            return self._shards[index].get(session_id)
 
     def set(self, session_id: str, data: SessionData) -> None:
         """Persist session data for the given session id."""
-        self._sessions[session_id] = data
+        index = self._index(session_id)
+        with self._locks[index]:
+            self._shards[index][session_id] = data
+            if data.proposal is not None:
+                self._proposal_ids[index].add(session_id)
+            else:
+                self._proposal_ids[index].discard(session_id)
+
+    def update(
+        self, session_id: str, apply: Callable[[SessionData], None]
+    ) -> Optional[SessionData]:
+        """Apply a change to the stored session atomically.
+
+        Args:
+            session_id: Session identifier
+            apply: Mutates the current session data in place
+
+        Returns:
+            The updated session data, or None if the session does not exist
+        """
+        index = self._index(session_id)
+        with self._locks[index]:
+            data = self._shards[index].get(session_id)
+            if data is None:
+                return None
+            apply(data)
+            if data.proposal is not None:
+                self._proposal_ids[index].add(session_id)
+            else:
+                self._proposal_ids[index].discard(session_id)
+            return data
 
     def delete(self, session_id: str) -> None:
         """Remove a session if it exists in the store."""
-        if session_id in self._sessions:
-            del self._sessions[session_id]
+        index = self._index(session_id)
+        with self._locks[index]:
+            self._shards[index].pop(session_id, None)
+            self._proposal_ids[index].discard(session_id)
 
     def clear(self) -> None:
         """Remove all sessions from the store."""
-        self._sessions.clear()
+        for shard, proposal_ids, lock in zip(self._shards, self._proposal_ids, self._locks):
+            with lock:
+                shard.clear()
+                proposal_ids.clear()
+
+    def get_all_with_proposals(self) -> Dict[str, SessionData]:
+        """Get all sessions that have stored proposals.
+
+        Returns:
+            Dictionary mapping session_id to SessionData for sessions with proposals
+        """
+        result: Dict[str, SessionData] = {}
+        for shard, proposal_ids, lock in zip(self._shards, self._proposal_ids, self._locks):
+            with lock:
+                result.update((sid, shard[sid]) for sid in proposal_ids)
+        return result
+
+
+class MemcachedSessionStore:
+    """Memcached-backed session store shared by every web worker.
+
+    Session data is pickled without its in-process pricing task handle. Memcached
+    cannot enumerate keys, so sessions holding a proposal are also listed under an
+    index key; clear() only removes those sessions and the rest age out via expire.
+    """
+
+    def __init__(
+        self,
+        servers: Optional[List[str]] = None,
+        key_prefix: str = "pricing-session:",
+        expire: int = DEFAULT_SESSION_TTL_SECONDS,
+        client: Any = None,
+    ) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            servers: Memcached servers as "host:port" strings (ignored when client is given)
+            key_prefix: Prefix applied to every key written by this store
+            expire: Session lifetime in seconds, refreshed on every write
+            client: Optional pre-built pymemcache-compatible client
+        """
+        if client is None:
+            if HashClient is None:
+                raise RuntimeError(
+                    "pymemcache is not installed. Install it to use MemcachedSessionStore."
+                )
+            client = HashClient(
+                [_parse_server(server) for server in servers or []],
+                key_prefix=key_prefix.encode("ascii"),
+                use_pooling=True,
+            )
+        self._client = client
+        self._expire = expire
+
+    def get(self, session_id: str) -> Optional[SessionData]:
+        """Return session data for a session id, if present."""
+        raw = self._client.get(session_id)
+        return pickle.loads(raw) if raw is not None else None
+
+    def set(self, session_id: str, data: SessionData) -> None:
+        """Persist session data for the given session id."""
+        self._client.set(session_id, _dump_session(data), expire=self._expire)
+        if data.proposal is not None:
+            self._update_index(session_id, present=True)
+
+    def update(
+        self, session_id: str, apply: Callable[[SessionData], None]
+    ) -> Optional[SessionData]:
+        """Apply a change to the stored session using CAS.
+
+        The change is re-applied to a fresh copy when another worker wrote the
+        session in between, so concurrent writes are not overwritten.
+
+        Args:
+            session_id: Session identifier
+            apply: Mutates the current session data in place
+
+        Returns:
+            The updated session data, or None if the session does not exist or
+            kept changing across every retry
+        """
+        for _ in range(_SESSION_CAS_RETRIES):
+            raw, cas = self._client.gets(session_id)
+            if raw is None:
+                return None
+
+            data = pickle.loads(raw)
+            apply(data)
+            if self._client.cas(
+                session_id, _dump_session(data), cas, expire=self._expire, noreply=False
+            ):
+                if data.proposal is not None:
+                    self._update_index(session_id, present=True)
+                return data
+
+        logger.warning("Failed to update session %s after concurrent writes", session_id)
+        return None
+
+    def delete(self, session_id: str) -> None:
+        """Remove a session if it exists in the store."""
+        self._client.delete(session_id)
+        self._update_index(session_id, present=False)
+
+    def clear(self) -> None:
+        """Remove every indexed session and the proposal index."""
+        session_ids = self._read_index()[0]
+        if session_ids:
+            self._client.delete_many(list(session_ids))
+        self._client.delete(_PROPOSAL_INDEX_KEY)
 
     def get_all_with_proposals(self) -> Dict[str, SessionData]:
         """Get all sessions that have stored proposals.
-        
+
         Returns:
             Dictionary mapping session_id to SessionData for sessions with proposals
         """
-        return {sid: data for sid, data in self._sessions.items() if data.proposal is not None}
+        session_ids = self._read_index()[0]
+        if not session_ids:
+            return {}
+
+        result: Dict[str, SessionData] = {}
+        for session_id, raw in self._client.get_many(sorted(session_ids)).items():
+            data = pickle.loads(raw)
+            if data.proposal is not None:
+                result[session_id] = data
+        return result
+
+    def _read_index(self) -> Tuple[Set[str], bool, Any]:
+        """Return the indexed session ids and the CAS token for the index key."""
+        raw, cas = self._client.gets(_PROPOSAL_INDEX_KEY)
+        session_ids: Set[str] = set(raw.decode("ascii").split()) if raw else set()
+        return session_ids, raw is not None, cas
+
+    def _update_index(self, session_id: str, present: bool) -> None:
+        """Add or remove a session id from the proposal index using CAS."""
+        for _ in range(_INDEX_CAS_RETRIES):
+            session_ids, exists, cas = self._read_index()
+            if (session_id in session_ids) == present:
+                return
+
+            if present:
+                session_ids.add(session_id)
+            else:
+                session_ids.discard(session_id)
+            body = " ".join(sorted(session_ids)).encode("ascii")
+
+            if exists:
+                stored = self._client.cas(_PROPOSAL_INDEX_KEY, body, cas, noreply=False)
+            else:
+                stored = self._client.add(_PROPOSAL_INDEX_KEY, body, noreply=False)
+            if stored:
+                return
+
+        logger.warning("Failed to update proposal index for session %s", session_id)
+
+
+def _parse_server(server: str):
+    """Split a "host:port" string into a pymemcache server tuple."""
+    host, _, port = server.strip().rpartition(":")
+    return (host, int(port)) if host else (port, 11211)
+
+
+def _dump_session(data: SessionData) -> bytes:
+    """Pickle session data, dropping the asyncio task handle that cannot cross processes."""
+    if data.pricing_task_handle is not None:
+        data = dataclasses.replace(data, pricing_task_handle=None)
+    return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def create_session_store():
+    """Return a Memcached store when MEMCACHED_SERVERS is set, else an in-memory store."""
+    servers = get_memcached_servers()
+    if servers:
+        return MemcachedSessionStore(servers)
+    return InMemorySessionStore()
@@ -1,5 +1,6 @@
 """Execution context for interface operations."""
 
+import asyncio
 from typing import Optional
 
 from azure.identity.aio import DefaultAzureCredential
@@ -14,6 +15,12 @@ class InterfaceContext:
     Encapsulates Azure AI client and session management for interface operations.
     
     Can be used as an async context manager to ensure proper resource cleanup.
+    Nested entries on the same event loop share the already-open client, so an
+    outer ``async with`` keeps one client alive across many operations.
+
+    The nesting counter is not locked: a context must only be entered by one
+    thread and event loop at a time (the CLI session). The web interface gives
+    each request its own context via ``WebInterface.request_context()``.
     """
 
     def __init__(self, session_store: Optional[InMemorySessionStore] = None):
@@ -26,6 +33,8 @@ class InterfaceContext:
         self.client: Optional[AzureAIAgentClient] = None
         self.session_store = session_store or InMemorySessionStore()
         self._credential: Optional[DefaultAzureCredential] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._depth = 0
 
     async def __aenter__(self) -> "InterfaceContext":
         """
@@ -37,6 +46,11 @@ class InterfaceContext:
         Raises:
             RuntimeError: If AZURE_AI_PROJECT_ENDPOINT is not configured.
         """
+        loop = asyncio.get_running_loop()
+        if self._depth and self._loop is loop and self.client is not None:
+            self._depth += 1
+            return self
+
         try:
             endpoint = get_ai_endpoint()
         except RuntimeError as err:
@@ -48,6 +62,8 @@ class InterfaceContext:
         )
         # Note: client.__aenter__ is called when used with AzureAIAgentClient directly
         await self.client.__aenter__()
+        self._loop = loop
+        self._depth = 1
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -59,6 +75,10 @@ class InterfaceContext:
             exc_val: Exception value if an error occurred
             exc_tb: Exception traceback if an error occurred
         """
+        self._depth = max(self._depth - 1, 0)
+        if self._depth:
+            return
+
         if self.client:
             try:
                 await self.client.__aexit__(exc_type, exc_val, exc_tb)
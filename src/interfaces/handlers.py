@@ -1,7 +1,10 @@
 """Shared workflow handlers for both CLI and Web interfaces."""
 
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple
 
 from opentelemetry.trace import SpanKind
 
@@ -11,9 +14,9 @@ from src.core.orchestrator import (
     history_to_requirements,
     reset_session,
     run_bom_pricing_proposal,
-    run_question_turn,
+    run_question_turn_with_session,
 )
-from src.core.models import ProposalBundle
+from src.core.models import ProposalBundle, SessionData
 from src.shared.errors import WorkflowError
 from src.web.session_tracing import end_session_span
 from .context import InterfaceContext
@@ -55,6 +58,12 @@ class WorkflowHandler:
     for chat turns, proposal generation, and session management.
     """
 
+    def __init__(self) -> None:
+        # In-flight chat turns keyed by (session_id, message). Web requests run
+        # on their own event loops, so a thread-safe Future is used for fan-out.
+        self._inflight_turns: Dict[Tuple[str, str], Future] = {}
+        self._inflight_lock = threading.Lock()
+
     async def handle_chat_turn(
         self,
         context: InterfaceContext,
@@ -67,6 +76,11 @@ class WorkflowHandler:
         The Architect Agent progressively builds BOM items during conversation.
         This is the shared implementation used by both CLI and Web interfaces.
 
+        Concurrent duplicates of the same turn (e.g. client retries while the
+        first request is still waiting on the agent) are coalesced so a single
+        agent call serves all of them; each caller receives its own copy of
+        the result.
+
         Args:
             context: InterfaceContext with initialized client and session store
             session_id: Unique identifier for the chat session
@@ -79,6 +93,63 @@ class WorkflowHandler:
                 - 'history': Full chat history
                 - 'bom_items': Identified services and SKUs
         """
+        result, _ = await self.handle_chat_turn_with_session(context, session_id, message)
+        return result
+
+    async def handle_chat_turn_with_session(
+        self,
+        context: InterfaceContext,
+        session_id: str,
+        message: str,
+    ) -> Tuple[Dict[str, Any], Optional[SessionData]]:
+        """
+        Process a single chat turn and also return the session it updated.
+
+        Args:
+            context: InterfaceContext with initialized client and session store
+            session_id: Unique identifier for the chat session
+            message: User's input message
+
+        Returns:
+            Tuple of the handle_chat_turn result and the updated SessionData,
+            or None when the turn failed before the session was saved
+        """
+        key = (session_id, message)
+        with self._inflight_lock:
+            pending = self._inflight_turns.get(key)
+            if pending is None:
+                pending = Future()
+                # Mark it running so a cancelled follower cannot cancel the
+                # shared future out from under the leader.
+                pending.set_running_or_notify_cancel()
+                self._inflight_turns[key] = pending
+                leader = True
+            else:
+                leader = False
+
+        if not leader:
+            logger.debug("Coalescing duplicate chat turn for %s", session_id)
+            result, session_data = await asyncio.wrap_future(pending)
+            return dict(result), session_data
+
+        try:
+            result, session_data = await self._run_chat_turn(context, session_id, message)
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight_turns.pop(key, None)
+        pending.set_result((result, session_data))
+        return dict(result), session_data
+
+    async def _run_chat_turn(
+        self,
+        context: InterfaceContext,
+        session_id: str,
+        message: str,
+    ) -> Tuple[Dict[str, Any], Optional[SessionData]]:
+        """Run one chat turn against the Architect Agent (see handle_chat_turn)."""
         with _handler_span(
             "chat_turn",
             session_id=session_id,
@@ -90,19 +161,19 @@ class WorkflowHandler:
                     "error": "Context not properly initialized",
                     "response": "",
                     "is_done": False,
-                }
+                }, None
 
             try:
-                result = await run_question_turn(
+                result, session_data = await run_question_turn_with_session(
                     context.client,
                     context.session_store,
                     session_id,
                     message,
                 )
                 logger.debug(
-                    f"Chat turn complete for {session_id}: is_done={result.get('is_done')}"
+                    "Chat turn complete for %s: is_done=%s", session_id, result.get("is_done")
                 )
-                return result
+                return result, session_data
             except WorkflowError as e:
                 # Turn limit reached - trigger proposal generation UI
                 if "Maximum conversation turns" in str(e):
@@ -110,14 +181,14 @@ class WorkflowHandler:
                         "response": str(e),
                         "error": str(e),
                         "is_done": True,
-                    }
+                    }, None
                 raise
             except Exception as e:
                 return {
                     "error": str(e),
                     "response": f"Error: {str(e)}",
                     "is_done": False,
-                }
+                }, None
 
     async def handle_proposal_generation(
         self,
@@ -147,12 +218,12 @@ class WorkflowHandler:
 
             session_data = context.session_store.get(session_id)
             if not session_data:
-                logger.warning(f"No session data found for proposal generation: {session_id}")
+                logger.warning("No session data found for proposal generation: %s", session_id)
                 return {"error": "No active session found"}
 
             try:
                 requirements = history_to_requirements(session_data.history)
-                logger.info(f"Generating proposal for session {session_id}")
+                logger.info("Generating proposal for session %s", session_id)
 
                 # Pass BOM items from Architect Agent to proposal generation
                 bundle: ProposalBundle = await run_bom_pricing_proposal(
@@ -160,20 +231,21 @@ class WorkflowHandler:
                 )
 
                 logger.info(
-                    f"Proposal generated for session {session_id}: "
-                    f"BOM={len(bundle.bom_text)} chars, "
-                    f"Pricing={len(bundle.pricing_text)} chars, "
-                    f"Proposal={len(bundle.proposal_text)} chars"
+                    "Proposal generated for session %s: BOM=%d chars, Pricing=%d chars, Proposal=%d chars",
+                    session_id,
+                    len(bundle.bom_text),
+                    len(bundle.pricing_text),
+                    len(bundle.proposal_text),
                 )
 
                 # Store proposal in session for retrieval
                 session_data.proposal = bundle
                 context.session_store.set(session_id, session_data)
-                logger.debug(f"Proposal stored in session {session_id}")
+                logger.debug("Proposal stored in session %s", session_id)
 
                 # End session span after successful proposal generation
                 end_session_span(session_id)
-                logger.debug(f"Session span ended for {session_id}")
+                logger.debug("Session span ended for %s", session_id)
 
                 return {
                     "bom": bundle.bom_text,
@@ -181,7 +253,7 @@ class WorkflowHandler:
                     "proposal": bundle.proposal_text,
                 }
             except Exception as e:
-                logger.error(f"Error generating proposal for session {session_id}: {e}")
+                logger.error("Error generating proposal for session %s: %s", session_id, e)
                 # End session span even on error to avoid orphaned spans
                 end_session_span(session_id)
                 return {"error": str(e)}
@@ -227,6 +299,27 @@ class WorkflowHandler:
 
         return {"history": session_data.history}
 
+    def get_session_history_list(
+        self,
+        context: InterfaceContext,
+        session_id: str,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get chat history for a session as a plain list.
+
+        Args:
+            context: InterfaceContext with session store
+            session_id: Unique identifier for the chat session
+
+        Returns:
+            List of chat messages (empty if the session does not exist)
+        """
+        session_data = context.session_store.get(session_id)
+        if not session_data:
+            return []
+
+        return session_data.history
+
     def get_stored_proposal(
         self,
         context: InterfaceContext,
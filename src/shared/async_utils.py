@@ -43,6 +43,10 @@ def run_coroutine(coro: Coroutine[Any, Any, T]) -> T:
 
     This mirrors asyncio.run but adds the custom exception handler and a guarded
     shutdown sequence so generator cleanup errors do not leak to stderr.
+
+    The coroutine runs in a copy of the caller's contextvars. That copy is not
+    wasted work: Flask views enter the session span with trace.use_span, and the
+    copied context is what carries it into agent and MCP calls.
     """
     loop = create_event_loop()
     asyncio.set_event_loop(loop)
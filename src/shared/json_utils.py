@@ -0,0 +1,23 @@
+"""Fast JSON encoding helpers for web responses and SSE frames.
+
+Uses orjson when it is installed and falls back to a precomputed standard
+library encoder otherwise. Both paths produce compact UTF-8 bytes.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return _ENCODER.encode(obj).encode("utf-8")
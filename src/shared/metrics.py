@@ -6,12 +6,20 @@ This module provides metrics counters for monitoring application behavior:
 - errors_total: Count of errors by type
 
 Metrics are exported to OTLP endpoint when ENABLE_OTEL=true.
+
+Increments are buffered in per-thread count tables and flushed to the
+OpenTelemetry counters by a background thread, so request handlers only pay
+for a dictionary update instead of an instrument lookup per call. Each flush
+empties the tables, so per-session keys do not accumulate in the process.
 """
 
 from __future__ import annotations
 
+import atexit
 import logging
-from typing import Optional
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
 
 from opentelemetry import metrics
 from opentelemetry.sdk.metrics import MeterProvider
@@ -26,6 +34,31 @@ _chat_turns_counter = None
 _proposals_counter = None
 _errors_counter = None
 
+_FLUSH_INTERVAL_SECONDS = 1.0
+
+# Buffer keys are (counter name, attribute items); values are counts since the
+# last flush.
+_BufferKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class _ThreadBuffer:
+    """Counts recorded by one thread since the last flush."""
+
+    __slots__ = ("thread", "counts", "lock")
+
+    def __init__(self, thread: threading.Thread) -> None:
+        self.thread = thread
+        self.counts: Dict[_BufferKey, int] = {}
+        # Only ever contended by the flusher swapping out the counts
+        self.lock = threading.Lock()
+
+
+_local = threading.local()
+_buffers: List[_ThreadBuffer] = []
+_buffers_lock = threading.Lock()
+_flush_lock = threading.Lock()
+_flusher: Optional[threading.Thread] = None
+
 
 def configure_metrics() -> None:
     """Configure OpenTelemetry metrics with OTLP exporter."""
@@ -87,6 +120,8 @@ def configure_metrics() -> None:
             unit="1",
         )
 
+        _start_flusher()
+
         logger.info("OpenTelemetry metrics configured successfully")
         _METRICS_CONFIGURED = True
 
@@ -95,6 +130,71 @@ def configure_metrics() -> None:
         _METRICS_CONFIGURED = True
 
 
+def _start_flusher() -> None:
+    """Start the background thread that forwards buffered counts to OpenTelemetry."""
+    global _flusher
+
+    if _flusher is not None:
+        return
+
+    def _run() -> None:
+        while True:
+            time.sleep(_FLUSH_INTERVAL_SECONDS)
+            try:
+                flush_metrics()
+            except Exception as e:
+                logger.debug(f"Failed to flush metrics: {e}")
+
+    _flusher = threading.Thread(target=_run, name="metrics-flusher", daemon=True)
+    _flusher.start()
+    atexit.register(flush_metrics)
+
+
+def _record(name: str, attributes: Tuple[Tuple[str, str], ...]) -> None:
+    """Add one to the calling thread's buffered total for a counter."""
+    buffer = getattr(_local, "buffer", None)
+    if buffer is None:
+        buffer = _local.buffer = _ThreadBuffer(threading.current_thread())
+        with _buffers_lock:
+            _buffers.append(buffer)
+
+    key = (name, attributes)
+    with buffer.lock:
+        counts = buffer.counts
+        counts[key] = counts.get(key, 0) + 1
+
+
+def flush_metrics() -> None:
+    """Forward buffered increments to the OpenTelemetry counters."""
+    counters = {
+        "chat_turns": _chat_turns_counter,
+        "proposals": _proposals_counter,
+        "errors": _errors_counter,
+    }
+
+    with _flush_lock:
+        with _buffers_lock:
+            entries = list(_buffers)
+
+        pending: Dict[_BufferKey, int] = {}
+        for buffer in entries:
+            # Check liveness first so increments made just before exit are kept.
+            alive = buffer.thread.is_alive()
+            with buffer.lock:
+                counts, buffer.counts = buffer.counts, {}
+            for key, delta in counts.items():
+                pending[key] = pending.get(key, 0) + delta
+
+            if not alive:
+                with _buffers_lock:
+                    _buffers.remove(buffer)
+
+        for (name, attributes), delta in pending.items():
+            counter = counters.get(name)
+            if counter:
+                counter.add(delta, dict(attributes))
+
+
 def increment_chat_turns(session_id: str) -> None:
     """
     Increment chat turns counter.
@@ -103,7 +203,7 @@ def increment_chat_turns(session_id: str) -> None:
         session_id: Session identifier for attribution
     """
     if _chat_turns_counter:
-        _chat_turns_counter.add(1, {"session_id": session_id})
+        _record("chat_turns", (("session_id", session_id),))
 
 
 def increment_proposals_generated(session_id: str, success: bool = True) -> None:
@@ -115,7 +215,7 @@ def increment_proposals_generated(session_id: str, success: bool = True) -> None
         success: Whether proposal generation succeeded
     """
     if _proposals_counter:
-        _proposals_counter.add(1, {"session_id": session_id, "success": str(success)})
+        _record("proposals", (("session_id", session_id), ("success", str(success))))
 
 
 def increment_errors(error_type: str, session_id: Optional[str] = None) -> None:
@@ -127,7 +227,7 @@ def increment_errors(error_type: str, session_id: Optional[str] = None) -> None:
         session_id: Optional session identifier for attribution
     """
     if _errors_counter:
-        attributes = {"error_type": error_type}
+        attributes: Tuple[Tuple[str, str], ...] = (("error_type", error_type),)
         if session_id:
-            attributes["session_id"] = session_id
-        _errors_counter.add(1, attributes)
+            attributes += (("session_id", session_id),)
+        _record("errors", attributes)
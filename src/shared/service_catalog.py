@@ -4,7 +4,7 @@ This module provides a fallback for service discovery when the Azure Pricing MCP
 is not available. It contains commonly used Azure services and their typical SKUs.
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 # Common Azure services with their typical SKUs
 AZURE_SERVICES_CATALOG: Dict[str, Dict[str, any]] = {
@@ -151,6 +151,18 @@ AZURE_SERVICES_CATALOG: Dict[str, Dict[str, any]] = {
 }
 
 
+# Flattened search rows (name, description, lowercased name, keywords) built once at import
+_SEARCH_INDEX: Tuple[Tuple[str, str, str, Tuple[str, ...]], ...] = tuple(
+    (
+        service_name,
+        service_info["description"],
+        service_name.lower(),
+        tuple(service_info.get("keywords", [])),
+    )
+    for service_name, service_info in AZURE_SERVICES_CATALOG.items()
+)
+
+
 def search_services(query: str) -> List[Dict[str, str]]:
     """
     Search for Azure services matching the query.
@@ -164,25 +176,24 @@ def search_services(query: str) -> List[Dict[str, str]]:
     query_lower = query.lower()
     matches = []
 
-    for service_name, service_info in AZURE_SERVICES_CATALOG.items():
+    for service_name, description, name_lower, keywords in _SEARCH_INDEX:
         # Check if query matches service name
-        if query_lower in service_name.lower():
+        if query_lower in name_lower:
             matches.append(
                 {
                     "serviceName": service_name,
-                    "description": service_info["description"],
+                    "description": description,
                     "match_reason": "name",
                 }
             )
             continue
 
         # Check if query matches any keywords
-        keywords = service_info.get("keywords", [])
         if any(query_lower in keyword for keyword in keywords):
             matches.append(
                 {
                     "serviceName": service_name,
-                    "description": service_info["description"],
+                    "description": description,
                     "match_reason": "keyword",
                 }
             )
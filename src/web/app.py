@@ -1,22 +1,23 @@
 """Flask web application for Azure Pricing Assistant."""
 
 import asyncio
-import json
 import logging
 import os
+import secrets
 
 from flask import Flask, Response, jsonify, render_template, request, session
 
-from opentelemetry import trace
 from src.core.config import get_flask_secret, load_environment
-from src.core.session import InMemorySessionStore
+from src.core.session import create_session_store
 from src.shared.async_utils import run_coroutine
+from src.shared.json_utils import dumps
 from src.shared.logging import setup_logging
 from src.shared.tracing import configure_tracing
 from src.shared.metrics import configure_metrics
+from src.web.json_provider import OrjsonProvider
 from src.web.interface import WebInterface
 from src.web.handlers import WebHandlers
-from src.web.session_tracing import end_session_span, get_or_create_session_span
+from src.web.session_tracing import end_session_span, session_scope
 
 # Load environment and configure Flask
 load_environment()
@@ -44,13 +45,39 @@ TEMPLATES_DIR = os.path.join(BASE_DIR, "templates")
 STATIC_DIR = os.path.join(BASE_DIR, "static")
 
 app = Flask(__name__, template_folder=TEMPLATES_DIR, static_folder=STATIC_DIR)
+app.json = OrjsonProvider(app)
 app.secret_key = get_flask_secret()
 
 # Initialize shared components
-session_store = InMemorySessionStore()
+session_store = create_session_store()
 web_interface = WebInterface(session_store)
 handlers = WebHandlers(web_interface)
 
+# Disable proxy/compression buffering so progress events reach the browser immediately.
+_SSE_HEADERS = {
+    'Cache-Control': 'no-cache',
+    'X-Accel-Buffering': 'no',
+    'Content-Encoding': 'identity',
+}
+
+# Marks the end of a proposal stream in the SSE event queue.
+_STREAM_END = object()
+
+
+def _format_sse(event) -> bytes:
+    """Format an event dictionary as a single SSE data frame."""
+    return b"data: " + dumps(event) + b"\n\n"
+
+
+def _json_response(payload) -> Response:
+    """Build a JSON response using the fast encoder."""
+    return Response(dumps(payload), mimetype='application/json')
+
+
+# Bodies for responses that never change, serialized once at import.
+_HEALTH_BODY = dumps({'status': 'healthy'})
+_RESET_BODY = dumps({'status': 'reset'})
+
 
 @app.route('/')
 def index():
@@ -61,17 +88,18 @@ def index():
 @app.route('/api/chat', methods=['POST'])
 def chat():
     """Handle chat messages."""
-    data = request.json
-    session_id = session.get('session_id', os.urandom(16).hex())
-    session['session_id'] = session_id
+    data = request.get_json(cache=False) or {}
+    session_id = session.get('session_id')
+    if not session_id:
+        session_id = secrets.token_hex(16)
+        session['session_id'] = session_id
     
     user_message = data.get('message', '')
 
-    session_span = get_or_create_session_span(session_id)
-    with trace.use_span(session_span, end_on_exit=False):
+    with session_scope(session_id):
         try:
             result = run_coroutine(handlers.handle_chat(session_id, user_message))
-            return jsonify(result)
+            return _json_response(result)
         except Exception as e:
             return jsonify({'error': str(e)}), 500
 
@@ -84,11 +112,10 @@ def generate():
     if not session_id:
         return jsonify({'error': 'No active session'}), 400
     
-    session_span = get_or_create_session_span(session_id)
-    with trace.use_span(session_span, end_on_exit=False):
+    with session_scope(session_id):
         try:
             result = run_coroutine(handlers.handle_generate_proposal(session_id))
-            return jsonify(result)
+            return _json_response(result)
         except Exception as e:
             return jsonify({'error': str(e)}), 500
 
@@ -103,32 +130,50 @@ def generate_stream():
     
     def event_generator():
         """Bridge async generator to sync generator for Flask."""
-        session_span = get_or_create_session_span(session_id)
-        with trace.use_span(session_span, end_on_exit=False):
+        with session_scope(session_id):
             yield from _run_stream_generator(session_id)
 
     def _run_stream_generator(session_id: str):
-        """Run the async proposal stream in a dedicated event loop."""
+        """Run the async proposal stream in a dedicated event loop.
+
+        Events are pumped into a queue so that everything produced while the loop
+        was running is flushed to the client as a single write.
+        """
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
-        
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def _pump():
+            try:
+                async for event in handlers.handle_generate_proposal_stream(session_id):
+                    queue.put_nowait(event)
+            except Exception as e:
+                # Best-effort error reporting over SSE.
+                queue.put_nowait({'event_type': 'error', 'message': str(e)})
+            finally:
+                queue.put_nowait(_STREAM_END)
+
+        pump = loop.create_task(_pump())
         try:
-            async_gen = handlers.handle_generate_proposal_stream(session_id)
-            
             while True:
-                try:
-                    event = loop.run_until_complete(async_gen.__anext__())
-                    # Format as SSE
-                    yield f"data: {json.dumps(event)}\n\n"
-                except StopAsyncIteration:
+                batch = [loop.run_until_complete(queue.get())]
+                while not queue.empty():
+                    batch.append(queue.get_nowait())
+
+                finished = batch[-1] is _STREAM_END
+                if finished:
+                    batch.pop()
+                if batch:
+                    yield b"".join(_format_sse(event) for event in batch)
+                if finished:
                     break
-        except Exception as e:
-            # Best-effort error reporting over SSE.
-            yield f"data: {json.dumps({'event_type': 'error', 'message': str(e)})}\n\n"
         finally:
+            if not pump.done():
+                pump.cancel()
+                loop.run_until_complete(asyncio.gather(pump, return_exceptions=True))
             loop.close()
-    
-    return Response(event_generator(), mimetype='text/event-stream')
+
+    return Response(event_generator(), mimetype='text/event-stream', headers=_SSE_HEADERS)
 
 
 @app.route('/api/reset', methods=['POST'])
@@ -137,12 +182,11 @@ def reset():
     session_id = session.get('session_id')
     try:
         if session_id:
-            session_span = get_or_create_session_span(session_id)
-            with trace.use_span(session_span, end_on_exit=False):
+            with session_scope(session_id):
                 run_coroutine(handlers.handle_reset(session_id))
             end_session_span(session_id)
         session.clear()
-        return jsonify({'status': 'reset'})
+        return Response(_RESET_BODY, mimetype='application/json')
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -155,11 +199,12 @@ def history():
     if not session_id:
         return jsonify({'error': 'No active session', 'history': []}), 400
     
-    session_span = get_or_create_session_span(session_id)
-    with trace.use_span(session_span, end_on_exit=False):
+    with session_scope(session_id):
         try:
-            result = run_coroutine(handlers.handle_history(session_id))
-            return jsonify(result)
+            body = handlers.get_poll_body(
+                'history', session_id, lambda data: handlers.handle_get_history(session_id, data)
+            )
+            return Response(body, mimetype='application/json')
         except Exception as e:
             return jsonify({'error': str(e), 'history': []}), 500
 
@@ -175,11 +220,12 @@ def get_bom():
             'bom_items': []
         })
     
-    session_span = get_or_create_session_span(session_id)
-    with trace.use_span(session_span, end_on_exit=False):
+    with session_scope(session_id):
         try:
-            result = run_coroutine(handlers.handle_get_bom(session_id))
-            return jsonify(result)
+            body = handlers.get_poll_body(
+                'bom', session_id, lambda data: handlers.handle_get_bom(session_id, data)
+            )
+            return Response(body, mimetype='application/json')
         except Exception as e:
             return jsonify({'error': str(e), 'bom_items': []}), 500
 
@@ -201,10 +247,9 @@ def get_pricing():
             'pricing_task_error': None
         })
     
-    session_span = get_or_create_session_span(session_id)
-    with trace.use_span(session_span, end_on_exit=False):
+    with session_scope(session_id):
         try:
-            result = run_coroutine(handlers.handle_get_pricing(session_id))
+            result = handlers.handle_get_pricing(session_id)
             
             # Generate ETag from pricing_last_update timestamp
             etag = None
@@ -221,7 +266,7 @@ def get_pricing():
             if etag:
                 response.headers['ETag'] = etag
             if result.get('pricing_last_update'):
-                response.headers['Last-Modified'] = result['pricing_last_update']
+                response.last_modified = result['pricing_last_update']
             
             # Add Cache-Control to allow conditional requests
             response.headers['Cache-Control'] = 'no-cache'
@@ -239,8 +284,7 @@ def get_proposal():
     if not session_id:
         return jsonify({'error': 'No active session'}), 400
     
-    session_span = get_or_create_session_span(session_id)
-    with trace.use_span(session_span, end_on_exit=False):
+    with session_scope(session_id):
         try:
             result = handlers.handle_get_proposal(session_id)
             return jsonify(result)
@@ -253,7 +297,7 @@ def get_all_proposals():
     """Get all stored proposals across all sessions."""
     try:
         result = handlers.handle_get_all_proposals()
-        return jsonify(result)
+        return _json_response(result)
     except Exception as e:
         return jsonify({'error': str(e), 'proposals': [], 'count': 0}), 500
 
@@ -261,7 +305,9 @@ def get_all_proposals():
 @app.route('/health')
 def health():
     """Health check endpoint."""
-    return jsonify({'status': 'healthy'})
+    # Response objects are mutated after the view returns (session cookies,
+    # after_request hooks), so only the body is shared between requests.
+    return Response(_HEALTH_BODY, mimetype='application/json')
 
 
 if __name__ == '__main__':
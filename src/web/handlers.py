@@ -4,12 +4,30 @@ import asyncio
 import logging
 import os
 import re
-from typing import Any, Dict
-
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from src.core.models import SessionData
+from src.core.session import InMemorySessionStore
+from src.core.orchestrator import history_to_requirements, run_bom_pricing_proposal_stream
 from src.web.interface import WebInterface
 from src.web.models import ChatResponse, ProposalResponse
+from src.shared.json_utils import dumps
 from src.shared.metrics import increment_chat_turns, increment_proposals_generated, increment_errors
 
+_JSON_FENCE_PATTERN = re.compile(r"```json\s*[\s\S]*?```", flags=re.IGNORECASE)
+
+# Encoded UI poll bodies are reused briefly and the cache is capped so sessions
+# that stop polling do not accumulate for the life of the worker.
+_POLL_CACHE_TTL_SECONDS = 2.0
+_POLL_CACHE_MAX_ENTRIES = 10000
+
+# The /api/proposals payload is reused only briefly so expired sessions drop out
+_ALL_PROPOSALS_CACHE_TTL_SECONDS = 5.0
+
+
 def _sanitize_chat_response(response: str, is_done: bool) -> str:
     """
     Sanitize agent responses for user display.
@@ -19,7 +37,9 @@ def _sanitize_chat_response(response: str, is_done: bool) -> str:
     if not response:
         return ""
 
-    sanitized = re.sub(r"```json\s*[\s\S]*?```", "", response, flags=re.IGNORECASE)
+    sanitized = response
+    if "```" in sanitized:
+        sanitized = _JSON_FENCE_PATTERN.sub("", sanitized)
     sanitized = sanitized.strip()
 
     if is_done and sanitized.startswith("{") and sanitized.endswith("}"):
@@ -28,6 +48,14 @@ def _sanitize_chat_response(response: str, is_done: bool) -> str:
     return sanitized
 
 
+def _copy_proposals_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of a cached /api/proposals payload that callers may mutate."""
+    return {
+        "proposals": [dict(proposal) for proposal in payload["proposals"]],
+        "count": payload["count"],
+    }
+
+
 # Get logger (setup handled by application entry point)
 logger = logging.getLogger(__name__)
 
@@ -43,6 +71,15 @@ class WebHandlers:
             web_interface: WebInterface instance for handling requests
         """
         self.interface = web_interface
+        # Cached /api/proposals payload, rebuilt after proposals are generated or
+        # reset here, or once it is older than the TTL
+        self._all_proposals_cache: Optional[Dict[str, Any]] = None
+        self._all_proposals_store: Any = None
+        self._all_proposals_cached_at = 0.0
+        # Encoded poll bodies keyed by (endpoint, session_id) in write order, each
+        # with the session history_version it was built from and when
+        self._poll_cache: "OrderedDict[Tuple[str, str], Tuple[int, float, bytes]]" = OrderedDict()
+        self._poll_cache_lock = threading.Lock()
 
     async def handle_chat(self, session_id: str, message: str) -> Dict[str, Any]:
         """
@@ -55,7 +92,7 @@ class WebHandlers:
         Returns:
             Dictionary with response, is_done, requirements_summary, bom_items, and optional error
         """
-        logger.debug(f"Processing chat for session {session_id}, message length: {len(message)}")
+        logger.debug("Processing chat for session %s, message length: %d", session_id, len(message))
         
         try:
             # Increment chat turns metric
@@ -63,27 +100,14 @@ class WebHandlers:
             
             result = await self.interface.chat_turn(session_id, message)
 
-            response = _sanitize_chat_response(
+            # WebInterface already builds the full payload; only the text needs cleanup.
+            result["response"] = _sanitize_chat_response(
                 result.get("response") or "",
                 bool(result.get("is_done", False)),
             )
-
-            return {
-                "response": response,
-                "is_done": result.get("is_done", False),
-                "requirements_summary": result.get("requirements_summary"),
-                "bom_items": result.get("bom_items", []),
-                "bom_updated": result.get("bom_updated", False),
-                "pricing_items": result.get("pricing_items", []),
-                "pricing_total": result.get("pricing_total", 0.0),
-                "pricing_currency": result.get("pricing_currency", "USD"),
-                "pricing_date": result.get("pricing_date"),
-                "pricing_task_status": result.get("pricing_task_status", "idle"),
-                "pricing_task_error": result.get("pricing_task_error"),
-                "error": result.get("error"),
-            }
+            return result
         except Exception as e:
-            logger.error(f"Error in chat handler: {e}")
+            logger.error("Error in chat handler: %s", e)
             increment_errors("chat_error", session_id)
             raise
 
@@ -99,6 +123,7 @@ class WebHandlers:
         """
         try:
             result = await self.interface.generate_proposal(session_id)
+            self._all_proposals_cache = None
 
             if "error" in result:
                 increment_errors("proposal_error", session_id)
@@ -114,7 +139,7 @@ class WebHandlers:
                 "proposal": result.get("proposal", ""),
             }
         except Exception as e:
-            logger.error(f"Error in proposal generation handler: {e}")
+            logger.error("Error in proposal generation handler: %s", e)
             increment_errors("proposal_error", session_id)
             increment_proposals_generated(session_id, success=False)
             raise
@@ -129,12 +154,10 @@ class WebHandlers:
         Yields:
             Dict[str, Any] - Progress events
         """
-        from src.core.orchestrator import history_to_requirements, run_bom_pricing_proposal_stream
-
         # Get session data
         session_data = self.interface.context.session_store.get(session_id)
         if not session_data:
-            logger.warning(f"No session data found for streaming proposal: {session_id}")
+            logger.warning("No session data found for streaming proposal: %s", session_id)
             increment_errors("no_session", session_id)
             yield {"error": "No active session found"}
             return
@@ -142,10 +165,10 @@ class WebHandlers:
         try:
             # Get requirements from history
             requirements = history_to_requirements(session_data.history)
-            logger.info(f"Starting proposal stream for session {session_id}")
+            logger.info("Starting proposal stream for session %s", session_id)
 
             # Stream workflow events
-            async with self.interface.context as ctx:
+            async with self.interface.request_context() as ctx:
                 # Pass BOM items from Architect Agent to proposal generation
                 async for event in run_bom_pricing_proposal_stream(
                     ctx.client, requirements, session_data.bom_items or []
@@ -161,7 +184,7 @@ class WebHandlers:
             increment_proposals_generated(session_id, success=True)
             
         except Exception as e:
-            logger.error(f"Error in proposal stream for session {session_id}: {e}")
+            logger.error("Error in proposal stream for session %s: %s", session_id, e)
             increment_errors("proposal_stream_error", session_id)
             increment_proposals_generated(session_id, success=False)
             yield {"error": str(e)}
@@ -177,6 +200,8 @@ class WebHandlers:
             Dictionary with status
         """
         await self.interface.reset_session(session_id)
+        self._all_proposals_cache = None
+        self.invalidate_poll_cache(session_id)
         return {"status": "reset"}
 
     async def handle_history(self, session_id: str) -> Dict[str, Any]:
@@ -192,20 +217,98 @@ class WebHandlers:
         history = await self.interface.get_session_history(session_id)
         return {"history": history}
 
-    async def handle_get_bom(self, session_id: str) -> Dict[str, Any]:
+    def handle_get_history(
+        self, session_id: str, session_data: Optional[SessionData] = None
+    ) -> Dict[str, Any]:
+        """
+        Handle history polling without an event loop.
+
+        Args:
+            session_id: Unique session identifier
+            session_data: Session already loaded by the caller, if any
+
+        Returns:
+            Dictionary with:
+                - history: List of chat messages
+        """
+        if session_data is None:
+            session_data = self.interface.context.session_store.get(session_id)
+        return {"history": session_data.history if session_data else []}
+
+    def get_poll_body(
+        self,
+        kind: str,
+        session_id: str,
+        produce: Callable[[Optional[SessionData]], Dict[str, Any]],
+    ) -> bytes:
+        """
+        Return the encoded poll response, reusing it while the session is unchanged.
+
+        The session loaded for the version check is handed to ``produce`` so a
+        cache miss does not read the session store a second time.
+
+        Args:
+            kind: Poll endpoint name (e.g., "history", "bom")
+            session_id: Unique session identifier
+            produce: Builds the response payload from the loaded session (or None)
+
+        Returns:
+            JSON-encoded response body
+        """
+        session_data = self.interface.context.session_store.get(session_id)
+        if session_data is None:
+            # Expired or deleted sessions no longer need their cached bodies
+            self.invalidate_poll_cache(session_id)
+            return dumps(produce(None))
+
+        key = (kind, session_id)
+        version = session_data.history_version
+        now = time.monotonic()
+        with self._poll_cache_lock:
+            cached = self._poll_cache.get(key)
+        if cached and cached[0] == version and now - cached[1] < _POLL_CACHE_TTL_SECONDS:
+            return cached[2]
+
+        body = dumps(produce(session_data))
+        cutoff = now - _POLL_CACHE_TTL_SECONDS
+        with self._poll_cache_lock:
+            self._poll_cache.pop(key, None)
+            self._poll_cache[key] = (version, now, body)
+            # Entries are in write order, so expired ones are always at the front
+            while len(self._poll_cache) > _POLL_CACHE_MAX_ENTRIES or (
+                next(iter(self._poll_cache.values()))[1] < cutoff
+            ):
+                self._poll_cache.popitem(last=False)
+        return body
+
+    def invalidate_poll_cache(self, session_id: str) -> None:
+        """
+        Drop cached poll responses for a session.
+
+        Args:
+            session_id: Unique session identifier
+        """
+        with self._poll_cache_lock:
+            for kind in ("history", "bom"):
+                self._poll_cache.pop((kind, session_id), None)
+
+    def handle_get_bom(
+        self, session_id: str, session_data: Optional[SessionData] = None
+    ) -> Dict[str, Any]:
         """
         Handle BOM retrieval endpoint.
 
         Args:
             session_id: Unique session identifier
+            session_data: Session already loaded by the caller, if any
 
         Returns:
             Dictionary with:
                 - bom_items: List of BOM items
         """
-        return await self.interface.get_bom_items(session_id)
+        return self.interface.get_bom_items(session_id, session_data)
 
-    async def handle_get_pricing(self, session_id: str) -> Dict[str, Any]:
+    def handle_get_pricing(self, session_id: str) -> Dict[str, Any]:
         """
         Handle pricing retrieval endpoint.
 
@@ -219,10 +322,10 @@ class WebHandlers:
                 - pricing_currency: Currency code
                 - pricing_date: ISO 8601 date of pricing data
                 - pricing_task_status: Current task status (idle, queued, processing, complete, error)
-                - pricing_last_update: ISO 8601 timestamp of last pricing modification
+                - pricing_last_update: datetime of last pricing modification
                 - pricing_task_error: Error message if status is error
         """
-        return await self.interface.get_pricing_items(session_id)
+        return self.interface.get_pricing_items(session_id)
 
     def handle_get_proposal(self, session_id: str) -> Dict[str, Any]:
         """
@@ -244,19 +347,35 @@ class WebHandlers:
             Dictionary with proposals array containing session_id and proposal data
         """
         try:
-            sessions_with_proposals = self.interface.context.session_store.get_all_with_proposals()
-            
-            proposals = []
-            for session_id, session_data in sessions_with_proposals.items():
-                if session_data.proposal:
-                    proposals.append({
-                        "session_id": session_id,
-                        "bom": session_data.proposal.bom_text,
-                        "pricing": session_data.proposal.pricing_text,
-                        "proposal": session_data.proposal.proposal_text,
-                    })
-            
-            return {"proposals": proposals, "count": len(proposals)}
+            session_store = self.interface.context.session_store
+            now = time.monotonic()
+            cached = self._all_proposals_cache
+            if (
+                cached is not None
+                and self._all_proposals_store is session_store
+                and now - self._all_proposals_cached_at < _ALL_PROPOSALS_CACHE_TTL_SECONDS
+            ):
+                return _copy_proposals_payload(cached)
+
+            # The store only returns sessions whose proposal is set
+            proposals = [
+                {
+                    "session_id": session_id,
+                    "bom": session_data.proposal.bom_text,
+                    "pricing": session_data.proposal.pricing_text,
+                    "proposal": session_data.proposal.proposal_text,
+                }
+                for session_id, session_data in session_store.get_all_with_proposals().items()
+            ]
+            payload = {"proposals": proposals, "count": len(proposals)}
+
+            # Shared stores are written by other workers, which never clear this cache
+            if isinstance(session_store, InMemorySessionStore):
+                self._all_proposals_cache = payload
+                self._all_proposals_store = session_store
+                self._all_proposals_cached_at = now
+                return _copy_proposals_payload(payload)
+            return payload
         except Exception as e:
-            logger.error(f"Error retrieving all proposals: {e}")
+            logger.error("Error retrieving all proposals: %s", e)
             return {"error": str(e), "proposals": [], "count": 0}
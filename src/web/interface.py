@@ -1,8 +1,9 @@
 """Web interface implementation for Azure Pricing Assistant."""
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
+from src.core.models import SessionData
 from src.interfaces.base import PricingInterface
 from src.interfaces.context import InterfaceContext
 from src.interfaces.handlers import WorkflowHandler
@@ -24,6 +25,15 @@ class WebInterface(PricingInterface):
         self.context = InterfaceContext(session_store)
         self.handler = WorkflowHandler()
 
+    def request_context(self) -> InterfaceContext:
+        """Create a context for one web request over the shared session store.
+
+        Flask serves requests on many threads, each with its own event loop, and
+        the Azure client is bound to the loop that opened it, so every request
+        enters its own context rather than the shared ``self.context``.
+        """
+        return InterfaceContext(self.context.session_store)
+
     async def chat_turn(self, session_id: str, message: str) -> Dict[str, Any]:
         """
         Process a single chat turn for Web API.
@@ -35,39 +45,46 @@ class WebInterface(PricingInterface):
         Returns:
             JSON-compatible dictionary with response, is_done, BOM fields, and errors
         """
-        async with self.context as ctx:
-            result = await self.handler.handle_chat_turn(
+        async with self.request_context() as ctx:
+            result, session_data = await self.handler.handle_chat_turn_with_session(
                 ctx, session_id, message
             )
             
             # Log BOM updates for debugging (data is returned via handle_chat in handlers.py)
-            if result.get("bom_updated"):
-                bom_count = len(result.get("bom_items", []))
-                logger.debug(f"Session {session_id}: BOM updated, {bom_count} items")
-            
-            # Include pricing information in response
-            session_data = self.context.session_store.get(session_id)
-            pricing_info = {}
-            if session_data:
-                pricing_info = {
-                    "pricing_items": session_data.pricing_items or [],
-                    "pricing_total": session_data.pricing_total,
-                    "pricing_currency": session_data.pricing_currency,
-                    "pricing_date": session_data.pricing_date,
-                    "pricing_task_status": session_data.pricing_task_status,
-                    "pricing_task_error": session_data.pricing_task_error,
-                }
+            if result.get("bom_updated") and logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Session %s: BOM updated, %d items",
+                    session_id,
+                    len(result.get("bom_items", [])),
+                )
             
+            # Include pricing information in response, reusing the session loaded
+            # by the turn; only error results fall back to a store read.
+            if session_data is None:
+                session_data = self.context.session_store.get(session_id)
+
             # Remove history from web responses (optional - only if needed for bandwidth)
-            return {
+            payload = {
                 "response": result.get("response", ""),
                 "is_done": result.get("is_done", False),
                 "requirements_summary": result.get("requirements_summary"),
                 "bom_items": result.get("bom_items", []),
                 "bom_updated": result.get("bom_updated", False),
-                **pricing_info,  # Include pricing info
-                "error": result.get("error"),
             }
+            # Pricing fields are omitted until pricing has started for the session;
+            # early Q&A turns would otherwise carry only defaults.
+            if session_data and (
+                session_data.pricing_task_status != "idle"
+                or session_data.pricing_last_update is not None
+            ):
+                payload["pricing_items"] = session_data.pricing_items or []
+                payload["pricing_total"] = session_data.pricing_total
+                payload["pricing_currency"] = session_data.pricing_currency
+                payload["pricing_date"] = session_data.pricing_date
+                payload["pricing_task_status"] = session_data.pricing_task_status
+                payload["pricing_task_error"] = session_data.pricing_task_error
+            payload["error"] = result.get("error")
+            return payload
 
     async def generate_proposal(self, session_id: str) -> Dict[str, Any]:
         """
@@ -79,7 +96,7 @@ class WebInterface(PricingInterface):
         Returns:
             JSON-compatible dictionary with bom, pricing, and proposal text
         """
-        async with self.context as ctx:
+        async with self.request_context() as ctx:
             return await self.handler.handle_proposal_generation(ctx, session_id)
 
     async def reset_session(self, session_id: str) -> None:
@@ -101,31 +118,34 @@ class WebInterface(PricingInterface):
         Returns:
             List of chat messages
         """
-        history_dict = self.handler.get_session_history(self.context, session_id)
-        return history_dict.get("history", [])
+        return self.handler.get_session_history_list(self.context, session_id)
 
-    async def get_bom_items(self, session_id: str) -> Dict[str, Any]:
+    def get_bom_items(
+        self, session_id: str, session_data: Optional[SessionData] = None
+    ) -> Dict[str, Any]:
         """
         Get current BOM items for a session.
 
         Args:
             session_id: Unique identifier for the chat session
+            session_data: Session already loaded by the caller; skips the store read
 
         Returns:
             Dictionary with:
                 - bom_items: List of BOM items
         """
-        session_data = self.context.session_store.get(session_id)
+        if session_data is None:
+            session_data = self.context.session_store.get(session_id)
         if not session_data:
             return {
                 "bom_items": [],
             }
-        
+
         return {
             "bom_items": session_data.bom_items or [],
         }
 
-    async def get_pricing_items(self, session_id: str) -> Dict[str, Any]:
+    def get_pricing_items(self, session_id: str) -> Dict[str, Any]:
         """
         Get current pricing items and task status for a session.
 
@@ -139,7 +159,8 @@ class WebInterface(PricingInterface):
                 - pricing_currency: Currency code (e.g., "USD")
                 - pricing_date: ISO 8601 date of pricing data
                 - pricing_task_status: Current task status (idle, queued, processing, complete, error)
-                - pricing_last_update: ISO 8601 timestamp of last pricing modification (or None)
+                - pricing_last_update: datetime of last pricing modification (or None);
+                  the JSON provider emits it as an ISO 8601 string
                 - pricing_task_error: Error message if status is error (or None)
         """
         session_data = self.context.session_store.get(session_id)
@@ -153,19 +174,14 @@ class WebInterface(PricingInterface):
                 "pricing_last_update": None,
                 "pricing_task_error": None
             }
-        
-        # Format pricing_last_update as ISO 8601 string if present
-        last_update_str = None
-        if session_data.pricing_last_update:
-            last_update_str = session_data.pricing_last_update.isoformat()
-        
+
         return {
             "pricing_items": session_data.pricing_items or [],
             "pricing_total": session_data.pricing_total,
             "pricing_currency": session_data.pricing_currency,
             "pricing_date": session_data.pricing_date,
             "pricing_task_status": session_data.pricing_task_status,
-            "pricing_last_update": last_update_str,
+            "pricing_last_update": session_data.pricing_last_update,
             "pricing_task_error": session_data.pricing_task_error
         }
 
@@ -0,0 +1,49 @@
+"""Flask JSON provider backed by orjson when it is installed."""
+
+from datetime import date
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+_COMPACT_SEPARATORS = (",", ":")
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that encodes and decodes with orjson.
+
+    Falls back to Flask's default provider when orjson is missing or when a
+    caller asks for formatting orjson does not support (such as a custom indent).
+    Dates are emitted as ISO 8601 strings on both paths, matching orjson's
+    native datetime encoding.
+    """
+
+    @staticmethod
+    def default(o: Any) -> Any:
+        """Encode dates as ISO 8601 before deferring to Flask's defaults."""
+        if isinstance(o, date):
+            return o.isoformat()
+        return DefaultJSONProvider.default(o)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize data as a JSON string."""
+        if kwargs.get("separators") == _COMPACT_SEPARATORS:
+            kwargs.pop("separators")
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+
+        option = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=option).decode("utf-8")
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        """Deserialize JSON text or UTF-8 bytes."""
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
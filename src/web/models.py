@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatRequest:
     """Incoming chat message request."""
 
@@ -20,7 +20,7 @@ class ChatRequest:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatResponse:
     """Response to chat message."""
 
@@ -30,16 +30,12 @@ class ChatResponse:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON response."""
-        result = {
-            "response": self.response,
-            "is_done": self.is_done,
-        }
         if self.error:
-            result["error"] = self.error
-        return result
+            return {"response": self.response, "is_done": self.is_done, "error": self.error}
+        return {"response": self.response, "is_done": self.is_done}
 
 
-@dataclass
+@dataclass(slots=True)
 class ProposalResponse:
     """Response with generated proposal."""
 
@@ -9,8 +9,7 @@ This enables correlation of all operations within a single user session across:
 - Child spans created by orchestrator stages
 
 Usage:
-    span = get_or_create_session_span(session_id)
-    with trace.use_span(span, end_on_exit=False):
+    with session_scope(session_id):
         # All operations here share the session's trace context
         ...
     
@@ -20,9 +19,12 @@ Usage:
 
 from __future__ import annotations
 
+import threading
 import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Dict
+from typing import Any, Iterable, Iterator, List
 
 from agent_framework.observability import get_tracer
 
@@ -38,7 +40,23 @@ class _SessionSpan:
     created_at: float
 
 
-_SESSION_SPANS: Dict[str, _SessionSpan] = {}
+# Spans are striped across independently locked shards so concurrent requests
+# for different sessions neither race on one dict nor queue behind one lock.
+_SHARDS = 16  # Must be a power of two for the index mask below
+_LOCKS = [threading.Lock() for _ in range(_SHARDS)]
+# Each shard is kept in least-recently-used order for eviction.
+_MAPS: List["OrderedDict[str, _SessionSpan]"] = [OrderedDict() for _ in range(_SHARDS)]
+
+# Clients that disconnect never call end_session_span, so spans are also
+# bounded by count and age and ended when evicted.
+_MAX_SESSIONS = 10000
+_MAX_SESSIONS_PER_SHARD = _MAX_SESSIONS // _SHARDS
+_TTL_SECONDS = 3600
+
+
+def _shard(session_id: str) -> int:
+    """Return the shard index that owns a session id."""
+    return hash(session_id) & (_SHARDS - 1)
 
 
 def get_or_create_session_span(session_id: str) -> Any:
@@ -46,26 +64,55 @@ def get_or_create_session_span(session_id: str) -> Any:
     if trace is None:
         raise RuntimeError("OpenTelemetry is not available")
 
-    existing = _SESSION_SPANS.get(session_id)
-    if existing is not None:
-        return existing.span
-
-    tracer = get_tracer(instrumenting_module_name="azure_pricing_assistant.session")
-    span = tracer.start_span(
-        name="session.web",
-        attributes={"session.id": session_id, "session.type": "web"},
-    )
-    _SESSION_SPANS[session_id] = _SessionSpan(span=span, created_at=time.time())
+    index = _shard(session_id)
+    spans = _MAPS[index]
+    now = time.monotonic()
+    cutoff = now - _TTL_SECONDS
+    evicted: List[_SessionSpan] = []
+
+    with _LOCKS[index]:
+        existing = spans.get(session_id)
+        if existing is not None:
+            if existing.created_at >= cutoff:
+                spans.move_to_end(session_id)
+                return existing.span
+            evicted.append(spans.pop(session_id))
+
+        tracer = get_tracer(instrumenting_module_name="azure_pricing_assistant.session")
+        span = tracer.start_span(
+            name="session.web",
+            attributes={"session.id": session_id, "session.type": "web"},
+        )
+        spans[session_id] = _SessionSpan(span=span, created_at=now)
+
+        while len(spans) > _MAX_SESSIONS_PER_SHARD or next(iter(spans.values())).created_at < cutoff:
+            evicted.append(spans.popitem(last=False)[1])
+
+    _end_spans(evicted)
     return span
 
 
+@contextmanager
+def session_scope(session_id: str) -> Iterator[Any]:
+    """Activate the session's span for the enclosed block."""
+    span = get_or_create_session_span(session_id)
+    with trace.use_span(span, end_on_exit=False):
+        yield span
+
+
 def end_session_span(session_id: str) -> None:
     """End and remove the tracked session span, if present."""
-    existing = _SESSION_SPANS.pop(session_id, None)
-    if existing is None:
-        return
-
-    try:
-        existing.span.end()
-    except Exception:
-        pass
+    index = _shard(session_id)
+    with _LOCKS[index]:
+        existing = _MAPS[index].pop(session_id, None)
+    if existing is not None:
+        _end_spans((existing,))
+
+
+def _end_spans(entries: Iterable[_SessionSpan]) -> None:
+    """End spans that have been removed from tracking, ignoring exporter errors."""
+    for entry in entries:
+        try:
+            entry.span.end()
+        except Exception:
+            pass
@@ -18,6 +18,18 @@ from src.core.orchestrator import parse_question_completion
 RUN_LIVE_E2E = os.getenv("RUN_LIVE_E2E") == "1"
 
 
+async def _collect_stream(agent, message, thread, echo=False):
+    """Run an agent stream and return its joined text, printing it once at the end."""
+    parts = []
+    async for update in agent.run_stream(message, thread=thread):
+        if update.text:
+            parts.append(update.text)
+    text = "".join(parts)
+    if echo:
+        print(text, end='', flush=True)
+    return text
+
+
 @pytest.mark.asyncio
 async def test_e2e_simple_web_app():
     """
@@ -63,11 +75,7 @@ async def test_e2e_simple_web_app():
         user_input = "I need to build a web application that serves 5,000 users daily with peak loads"
         print(f"User: {user_input}\n")
         
-        response_text = ""
-        async for update in question_agent.run_stream(user_input, thread=question_thread):
-            if update.text:
-                response_text += update.text
-                print(update.text, end='', flush=True)
+        response_text = await _collect_stream(question_agent, user_input, question_thread, echo=True)
         
         # Verify completion format
         is_done, requirements = parse_question_completion(response_text)
@@ -77,11 +85,7 @@ async def test_e2e_simple_web_app():
             user_input2 = "I'll deploy to East US, use Azure App Service, SQL Database for data, and we need 50GB of storage"
             print(f"\nUser: {user_input2}\n")
             
-            response_text = ""
-            async for update in question_agent.run_stream(user_input2, thread=question_thread):
-                if update.text:
-                    response_text += update.text
-                    print(update.text, end='', flush=True)
+            response_text = await _collect_stream(question_agent, user_input2, question_thread, echo=True)
             
             is_done, requirements = parse_question_completion(response_text)
         
@@ -98,11 +102,7 @@ async def test_e2e_simple_web_app():
         
         print(f"Requirements input: {requirements}\n")
         
-        bom_response = ""
-        async for update in bom_agent.run_stream(requirements, thread=bom_thread):
-            if update.text:
-                bom_response += update.text
-                print(update.text, end='', flush=True)
+        bom_response = await _collect_stream(bom_agent, requirements, bom_thread, echo=True)
         
         # Parse and validate BOM
         print("\n\nValidating BOM schema...")
@@ -132,11 +132,7 @@ async def test_e2e_simple_web_app():
         bom_text = f"Bill of Materials:\n{bom_response}"
         print(f"BOM input to Pricing Agent: {bom_text[:200]}...\n")
         
-        pricing_response = ""
-        async for update in pricing_agent.run_stream(bom_text, thread=pricing_thread):
-            if update.text:
-                pricing_response += update.text
-                print(update.text, end='', flush=True)
+        pricing_response = await _collect_stream(pricing_agent, bom_text, pricing_thread, echo=True)
         
         # Parse and validate pricing
         print("\n\nValidating pricing schema...")
@@ -182,11 +178,7 @@ Pricing Analysis:
 {pricing_response}
 """
         
-        proposal_text = ""
-        async for update in proposal_agent.run_stream(proposal_input, thread=proposal_thread):
-            if update.text:
-                proposal_text += update.text
-                print(update.text, end='', flush=True)
+        proposal_text = await _collect_stream(proposal_agent, proposal_input, proposal_thread, echo=True)
         
         # Validate proposal
         print("\n\nValidating proposal format...")
@@ -240,11 +232,7 @@ async def test_e2e_database_workload():
         user_input = "I need to set up a data warehouse in Azure with 200GB of data, deployed in West US"
         print(f"User: {user_input}\n")
         
-        response_text = ""
-        async for update in question_agent.run_stream(user_input, thread=question_thread):
-            if update.text:
-                response_text += update.text
-                print(update.text, end='', flush=True)
+        response_text = await _collect_stream(question_agent, user_input, question_thread, echo=True)
         
         is_done, requirements = parse_question_completion(response_text)
         assert is_done, "Question Agent should complete"
@@ -252,10 +240,7 @@ async def test_e2e_database_workload():
         
         # BOM Agent
         bom_agent = create_bom_agent(client)
-        bom_response = ""
-        async for update in bom_agent.run_stream(requirements, thread=bom_agent.get_new_thread()):
-            if update.text:
-                bom_response += update.text
+        bom_response = await _collect_stream(bom_agent, requirements, bom_agent.get_new_thread())
         
         bom_data = parse_bom_response(bom_response)
         assert len(bom_data) >= 1, "BOM should have services"
@@ -263,10 +248,7 @@ async def test_e2e_database_workload():
         
         # Pricing Agent
         pricing_agent = create_pricing_agent(client)
-        pricing_response = ""
-        async for update in pricing_agent.run_stream(bom_response, thread=pricing_agent.get_new_thread()):
-            if update.text:
-                pricing_response += update.text
+        pricing_response = await _collect_stream(pricing_agent, bom_response, pricing_agent.get_new_thread())
         
         pricing_result = parse_pricing_response(pricing_response)
         assert "total_monthly" in pricing_result, "Pricing should have total"
@@ -274,13 +256,11 @@ async def test_e2e_database_workload():
         
         # Proposal Agent
         proposal_agent = create_proposal_agent(client)
-        proposal_text = ""
-        async for update in proposal_agent.run_stream(
+        proposal_text = await _collect_stream(
+            proposal_agent,
             f"Requirements: {requirements}\n\nBOM: {bom_response}\n\nPricing: {pricing_response}",
-            thread=proposal_agent.get_new_thread()
-        ):
-            if update.text:
-                proposal_text += update.text
+            proposal_agent.get_new_thread(),
+        )
         
         assert len(proposal_text) > 0, "Proposal should be generated"
         print(f"✅ Proposal generated\n")
@@ -297,8 +277,8 @@ async def main():
     print("=" * 80)
     
     try:
-        await test_e2e_simple_web_app()
-        await test_e2e_database_workload()
+        # The scenarios are independent, so run them concurrently.
+        await asyncio.gather(test_e2e_simple_web_app(), test_e2e_database_workload())
         
         print("\n" + "=" * 80)
         print("✅ ALL E2E TESTS PASSED!")
@@ -0,0 +1,135 @@
+"""Tests for cached /api/history and /api/bom polling endpoints."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.core.models import SessionData
+from src.core.session import InMemorySessionStore
+
+
+@pytest.fixture
+def app():
+    """Create a test Flask app."""
+    from src.web.app import app as flask_app
+
+    flask_app.config['TESTING'] = True
+    return flask_app
+
+
+@pytest.fixture
+def session_store(app):
+    """Install a fresh session store with one active session."""
+    from src.web.app import handlers
+
+    store = InMemorySessionStore()
+    store.set(
+        'poll-session',
+        SessionData(
+            thread=None,
+            history=[{"role": "user", "content": "I need a web app"}],
+            bom_items=[{"serviceName": "App Service", "sku": "P1v3"}],
+        ),
+    )
+    original_store = handlers.interface.context.session_store
+    handlers.interface.context.session_store = store
+    handlers._poll_cache.clear()
+    yield store
+    handlers.interface.context.session_store = original_store
+    handlers._poll_cache.clear()
+
+
+@pytest.fixture
+def client(app, session_store):
+    """Create a test client bound to the poll session."""
+    with app.test_client() as client:
+        with client.session_transaction() as sess:
+            sess['session_id'] = 'poll-session'
+        yield client
+
+
+class TestPollEndpointCache:
+    """Test version-keyed caching of polling responses."""
+
+    def test_history_reuses_body_while_version_unchanged(self, client, session_store):
+        """History is served from cache until history_version is bumped."""
+        first = client.get('/api/history').get_json()
+        assert len(first['history']) == 1
+
+        session_data = session_store.get('poll-session')
+        session_data.history.append({"role": "assistant", "content": "Which region?"})
+
+        assert client.get('/api/history').get_json() == first
+
+        session_data.history_version += 1
+
+        assert len(client.get('/api/history').get_json()['history']) == 2
+
+    def test_bom_refreshes_after_version_bump(self, client, session_store):
+        """BOM items are re-read once the session version changes."""
+        assert len(client.get('/api/bom').get_json()['bom_items']) == 1
+
+        session_data = session_store.get('poll-session')
+        session_data.bom_items.append({"serviceName": "SQL Database", "sku": "S1"})
+        session_data.history_version += 1
+
+        assert len(client.get('/api/bom').get_json()['bom_items']) == 2
+
+    def test_bom_cache_miss_reads_session_store_once(self, client, session_store):
+        """A BOM cache miss reuses the session loaded for the version check."""
+        with patch.object(session_store, 'get', wraps=session_store.get) as spy_get:
+            assert len(client.get('/api/bom').get_json()['bom_items']) == 1
+
+        assert spy_get.call_count == 1
+
+    def test_history_cache_miss_reads_session_store_once(self, client, session_store):
+        """A history cache miss reuses the session loaded for the version check."""
+        with patch.object(session_store, 'get', wraps=session_store.get) as spy_get:
+            assert len(client.get('/api/history').get_json()['history']) == 1
+
+        assert spy_get.call_count == 1
+
+    def test_reset_invalidates_cached_responses(self, client, session_store):
+        """Reset drops cached bodies so a new session never sees stale data."""
+        from src.web.app import handlers
+
+        client.get('/api/history')
+        client.get('/api/bom')
+        assert ('history', 'poll-session') in handlers._poll_cache
+
+        client.post('/api/reset')
+
+        assert ('history', 'poll-session') not in handlers._poll_cache
+        assert ('bom', 'poll-session') not in handlers._poll_cache
+
+    def test_expired_session_drops_cached_responses(self, client, session_store):
+        """Polls for a session that has left the store remove its cached bodies."""
+        from src.web.app import handlers
+
+        client.get('/api/history')
+        client.get('/api/bom')
+        session_store.delete('poll-session')
+
+        assert client.get('/api/bom').get_json() == {'bom_items': []}
+        assert ('history', 'poll-session') not in handlers._poll_cache
+        assert ('bom', 'poll-session') not in handlers._poll_cache
+
+    def test_writes_prune_expired_and_excess_entries(self, client, session_store):
+        """Writing a body evicts expired entries and the oldest beyond the cap."""
+        import time
+
+        from src.web import handlers as handlers_module
+        from src.web.app import handlers
+
+        handlers._poll_cache[('bom', 'abandoned')] = (0, 0.0, b'{}')
+        client.get('/api/bom')
+        assert list(handlers._poll_cache) == [('bom', 'poll-session')]
+
+        handlers._poll_cache[('history', 'other-session')] = (0, time.monotonic(), b'{}')
+        with patch.object(handlers_module, '_POLL_CACHE_MAX_ENTRIES', 1):
+            client.get('/api/history')
+
+        assert list(handlers._poll_cache) == [('history', 'poll-session')]
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
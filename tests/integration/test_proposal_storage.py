@@ -1,10 +1,100 @@
 """Tests for proposal storage mechanism."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock
 
 from src.core.models import SessionData, ProposalBundle
 from src.core.session import InMemorySessionStore
+from src.interfaces import handlers as workflow_handlers
+from src.interfaces.context import InterfaceContext
+from src.interfaces.handlers import WorkflowHandler
+from src.web.handlers import WebHandlers
+from src.web.interface import WebInterface
+
+# Placeholder agent thread; no test here calls into it.
+_THREAD_SENTINEL = object()
+
+# Conversation leading up to proposal generation. SessionData types history as
+# a list, so tests take a shallow copy; the message dicts are never mutated.
+_DEFAULT_HISTORY = (
+    {"role": "user", "content": "I need a web app"},
+    {"role": "assistant", "content": "What region?"},
+    {"role": "user", "content": "East US"},
+)
+
+# Bundles shared across tests; nothing under test mutates a ProposalBundle.
+_STORED_BUNDLE = ProposalBundle(
+    bom_text="Stored BOM",
+    pricing_text="Stored Pricing",
+    proposal_text="Stored Proposal"
+)
+_GENERATED_BUNDLE = ProposalBundle(
+    bom_text="Test BOM",
+    pricing_text="Test Pricing",
+    proposal_text="Test Proposal"
+)
+
+
+@pytest.fixture(scope="module")
+def session_store():
+    """Share one in-memory store across the module."""
+    return InMemorySessionStore()
+
+
+@pytest.fixture(autouse=True)
+def reset_session_store(session_store):
+    """Drop sessions written by a test before the next one runs."""
+    yield
+    session_store.clear()
+
+
+@pytest.fixture
+def context(session_store):
+    """Create an interface context over the shared store."""
+    return InterfaceContext(session_store)
+
+
+@pytest.fixture
+def interface(session_store):
+    """Create a WebInterface over the shared store."""
+    return WebInterface(session_store)
+
+
+@pytest.fixture
+def handlers(interface):
+    """Create WebHandlers bound to the interface fixture."""
+    return WebHandlers(interface)
+
+
+@pytest.fixture
+def stored_proposal(session_store):
+    """Store a session holding a generated proposal under "test_session"."""
+    session_store.set(
+        "test_session", SessionData(thread=_THREAD_SENTINEL, history=[], proposal=_STORED_BUNDLE)
+    )
+    return _STORED_BUNDLE
+
+
+def _via_handler(session_store, session_id):
+    return WorkflowHandler().get_stored_proposal(InterfaceContext(session_store), session_id)
+
+
+def _via_interface(session_store, session_id):
+    return WebInterface(session_store).get_stored_proposal(session_id)
+
+
+def _via_web_handlers(session_store, session_id):
+    return WebHandlers(WebInterface(session_store)).handle_get_proposal(session_id)
+
+
+@pytest.fixture
+def patched_bundle(monkeypatch):
+    """Stub proposal generation and session span teardown in the workflow handler."""
+    monkeypatch.setattr(
+        workflow_handlers, "run_bom_pricing_proposal", AsyncMock(return_value=_GENERATED_BUNDLE)
+    )
+    monkeypatch.setattr(workflow_handlers, "end_session_span", lambda *args, **kwargs: None)
+    return _GENERATED_BUNDLE
 
 
 class TestProposalStorageInSession:
@@ -18,60 +108,39 @@ class TestProposalStorageInSession:
 
     def test_session_data_stores_proposal_bundle(self):
         """Test that SessionData can store ProposalBundle."""
-        proposal = ProposalBundle(
-            bom_text="BOM content",
-            pricing_text="Pricing content",
-            proposal_text="Proposal content"
-        )
-        session_data = SessionData(thread=None, history=[], proposal=proposal)
+        session_data = SessionData(thread=None, history=[], proposal=_STORED_BUNDLE)
         
         assert session_data.proposal is not None
-        assert session_data.proposal.bom_text == "BOM content"
-        assert session_data.proposal.pricing_text == "Pricing content"
-        assert session_data.proposal.proposal_text == "Proposal content"
+        assert session_data.proposal.bom_text == "Stored BOM"
+        assert session_data.proposal.pricing_text == "Stored Pricing"
+        assert session_data.proposal.proposal_text == "Stored Proposal"
 
 
+@pytest.mark.xdist_group("proposal_storage_async")
 class TestProposalStorageInHandler:
     """Test proposal storage in WorkflowHandler."""
 
     @pytest.mark.asyncio
-    async def test_handle_proposal_generation_stores_proposal(self):
+    async def test_handle_proposal_generation_stores_proposal(
+        self, session_store, context, patched_bundle
+    ):
         """Test that handle_proposal_generation stores proposal in session."""
-        from src.interfaces.context import InterfaceContext
-        from src.interfaces.handlers import WorkflowHandler
-        
-        session_store = InMemorySessionStore()
         session_id = "test_session"
         
-        # Create session with mock thread and history
-        mock_thread = MagicMock()
+        # Create session with placeholder thread and history
         session_data = SessionData(
-            thread=mock_thread,
-            history=[
-                {"role": "user", "content": "I need a web app"},
-                {"role": "assistant", "content": "What region?"},
-                {"role": "user", "content": "East US"}
-            ]
+            thread=_THREAD_SENTINEL,
+            history=list(_DEFAULT_HISTORY)
         )
         session_store.set(session_id, session_data)
         
         # Mock the client and orchestrator
-        mock_client = MagicMock()
-        context = InterfaceContext(session_store)
+        mock_client = object()  # placeholder; the orchestrator call is patched
         context._client = mock_client
         
         handler = WorkflowHandler()
         
-        # Mock run_bom_pricing_proposal
-        mock_bundle = ProposalBundle(
-            bom_text="Test BOM",
-            pricing_text="Test Pricing",
-            proposal_text="Test Proposal"
-        )
-        
-        with patch("src.interfaces.handlers.run_bom_pricing_proposal", return_value=mock_bundle):
-            with patch("src.interfaces.handlers.end_session_span"):
-                result = await handler.handle_proposal_generation(context, session_id)
+        result = await handler.handle_proposal_generation(context, session_id)
         
         # Verify result
         assert "error" not in result
@@ -86,46 +155,8 @@ class TestProposalStorageInHandler:
         assert updated_session.proposal.pricing_text == "Test Pricing"
         assert updated_session.proposal.proposal_text == "Test Proposal"
 
-    @pytest.mark.asyncio
-    async def test_get_stored_proposal_returns_proposal(self):
-        """Test that get_stored_proposal returns stored proposal."""
-        from src.interfaces.context import InterfaceContext
-        from src.interfaces.handlers import WorkflowHandler
-        
-        session_store = InMemorySessionStore()
-        session_id = "test_session"
-        
-        # Create session with stored proposal
-        proposal = ProposalBundle(
-            bom_text="Stored BOM",
-            pricing_text="Stored Pricing",
-            proposal_text="Stored Proposal"
-        )
-        session_data = SessionData(
-            thread=MagicMock(),
-            history=[],
-            proposal=proposal
-        )
-        session_store.set(session_id, session_data)
-        
-        context = InterfaceContext(session_store)
-        handler = WorkflowHandler()
-        
-        result = handler.get_stored_proposal(context, session_id)
-        
-        assert "error" not in result
-        assert result["bom"] == "Stored BOM"
-        assert result["pricing"] == "Stored Pricing"
-        assert result["proposal"] == "Stored Proposal"
-
-    @pytest.mark.asyncio
-    async def test_get_stored_proposal_no_session(self):
+    def test_get_stored_proposal_no_session(self, context):
         """Test that get_stored_proposal returns error when no session exists."""
-        from src.interfaces.context import InterfaceContext
-        from src.interfaces.handlers import WorkflowHandler
-        
-        session_store = InMemorySessionStore()
-        context = InterfaceContext(session_store)
         handler = WorkflowHandler()
         
         result = handler.get_stored_proposal(context, "nonexistent_session")
@@ -133,20 +164,14 @@ class TestProposalStorageInHandler:
         assert "error" in result
         assert result["error"] == "Session not found"
 
-    @pytest.mark.asyncio
-    async def test_get_stored_proposal_no_proposal(self):
+    def test_get_stored_proposal_no_proposal(self, session_store, context):
         """Test that get_stored_proposal returns error when no proposal stored."""
-        from src.interfaces.context import InterfaceContext
-        from src.interfaces.handlers import WorkflowHandler
-        
-        session_store = InMemorySessionStore()
         session_id = "test_session"
         
         # Create session without proposal
-        session_data = SessionData(thread=MagicMock(), history=[])
+        session_data = SessionData(thread=_THREAD_SENTINEL, history=[])
         session_store.set(session_id, session_data)
         
-        context = InterfaceContext(session_store)
         handler = WorkflowHandler()
         
         result = handler.get_stored_proposal(context, session_id)
@@ -155,171 +180,96 @@ class TestProposalStorageInHandler:
         assert result["error"] == "No proposal found for this session"
 
 
-class TestProposalStorageInWebInterface:
-    """Test proposal storage through WebInterface."""
-
-    def test_web_interface_has_get_stored_proposal_method(self):
-        """Test that WebInterface has get_stored_proposal method."""
-        from src.web.interface import WebInterface
-        
-        session_store = InMemorySessionStore()
-        interface = WebInterface(session_store)
-        
-        assert hasattr(interface, "get_stored_proposal")
-        assert callable(interface.get_stored_proposal)
+class TestProposalStorageApiSurface:
+    """Test the proposal retrieval API exposed by the web layer."""
 
-    def test_web_interface_get_stored_proposal(self):
-        """Test WebInterface.get_stored_proposal returns stored proposal."""
-        from src.web.interface import WebInterface
-        
-        session_store = InMemorySessionStore()
-        session_id = "test_session"
-        
-        # Create session with stored proposal
-        proposal = ProposalBundle(
-            bom_text="Web BOM",
-            pricing_text="Web Pricing",
-            proposal_text="Web Proposal"
-        )
-        session_data = SessionData(
-            thread=MagicMock(),
-            history=[],
-            proposal=proposal
-        )
-        session_store.set(session_id, session_data)
-        
-        interface = WebInterface(session_store)
-        result = interface.get_stored_proposal(session_id)
-        
-        assert "error" not in result
-        assert result["bom"] == "Web BOM"
-        assert result["pricing"] == "Web Pricing"
-        assert result["proposal"] == "Web Proposal"
+    @pytest.mark.parametrize(
+        "cls, name",
+        [
+            (WebInterface, "get_stored_proposal"),
+            (WebHandlers, "handle_get_proposal"),
+        ],
+    )
+    def test_public_api_surface(self, cls, name):
+        """Test the retrieval methods exist without building any instances."""
+        assert callable(getattr(cls, name, None))
 
 
 class TestProposalStorageInWebHandlers:
     """Test proposal storage through WebHandlers."""
 
-    def test_web_handlers_has_handle_get_proposal_method(self):
-        """Test that WebHandlers has handle_get_proposal method."""
-        from src.web.interface import WebInterface
-        from src.web.handlers import WebHandlers
-        
-        session_store = InMemorySessionStore()
-        interface = WebInterface(session_store)
-        handlers = WebHandlers(interface)
-        
-        assert hasattr(handlers, "handle_get_proposal")
-        assert callable(handlers.handle_get_proposal)
-
-    def test_web_handlers_handle_get_proposal(self):
-        """Test WebHandlers.handle_get_proposal returns stored proposal."""
-        from src.web.interface import WebInterface
-        from src.web.handlers import WebHandlers
-        
-        session_store = InMemorySessionStore()
-        session_id = "test_session"
-        
-        # Create session with stored proposal
-        proposal = ProposalBundle(
-            bom_text="Handler BOM",
-            pricing_text="Handler Pricing",
-            proposal_text="Handler Proposal"
-        )
-        session_data = SessionData(
-            thread=MagicMock(),
-            history=[],
-            proposal=proposal
-        )
-        session_store.set(session_id, session_data)
-        
-        interface = WebInterface(session_store)
-        handlers = WebHandlers(interface)
-        
-        result = handlers.handle_get_proposal(session_id)
-        
-        assert "error" not in result
-        assert result["bom"] == "Handler BOM"
-        assert result["pricing"] == "Handler Pricing"
-        assert result["proposal"] == "Handler Proposal"
-
-    def test_web_handlers_handle_get_proposal_no_proposal(self):
+    def test_web_handlers_handle_get_proposal_no_proposal(self, session_store, handlers):
         """Test WebHandlers.handle_get_proposal with no proposal."""
-        from src.web.interface import WebInterface
-        from src.web.handlers import WebHandlers
-        
-        session_store = InMemorySessionStore()
         session_id = "test_session"
         
         # Create session without proposal
-        session_data = SessionData(thread=MagicMock(), history=[])
+        session_data = SessionData(thread=_THREAD_SENTINEL, history=[])
         session_store.set(session_id, session_data)
         
-        interface = WebInterface(session_store)
-        handlers = WebHandlers(interface)
-        
         result = handlers.handle_get_proposal(session_id)
         
         assert "error" in result
         assert "No proposal found" in result["error"]
 
 
+class TestStoredProposalRetrieval:
+    """Test stored proposal retrieval through each facade."""
+
+    @pytest.mark.parametrize(
+        "facade",
+        [
+            pytest.param(_via_handler, id="handler"),
+            pytest.param(_via_interface, id="interface"),
+            pytest.param(_via_web_handlers, id="web_handlers"),
+        ],
+    )
+    def test_returns_stored_proposal(self, session_store, stored_proposal, facade):
+        """Test the stored proposal is returned unchanged by every facade."""
+        result = facade(session_store, "test_session")
+
+        assert "error" not in result
+        assert result["bom"] == stored_proposal.bom_text
+        assert result["pricing"] == stored_proposal.pricing_text
+        assert result["proposal"] == stored_proposal.proposal_text
+
+
+@pytest.mark.xdist_group("proposal_storage_async")
 class TestProposalStorageEndToEnd:
     """Test end-to-end proposal storage and retrieval."""
 
     @pytest.mark.asyncio
-    async def test_generate_and_retrieve_proposal(self):
+    async def test_generate_and_retrieve_proposal(
+        self, session_store, interface, handlers, patched_bundle
+    ):
         """Test generating a proposal and then retrieving it."""
-        from src.web.interface import WebInterface
-        from src.web.handlers import WebHandlers
-        
-        session_store = InMemorySessionStore()
         session_id = "test_session"
         
-        # Create session with mock thread and history
-        mock_thread = MagicMock()
+        # Create session with placeholder thread and history
         session_data = SessionData(
-            thread=mock_thread,
-            history=[
-                {"role": "user", "content": "I need a web app"},
-                {"role": "assistant", "content": "What region?"},
-                {"role": "user", "content": "East US"}
-            ]
+            thread=_THREAD_SENTINEL,
+            history=list(_DEFAULT_HISTORY)
         )
         session_store.set(session_id, session_data)
         
-        # Create interface and handlers
-        interface = WebInterface(session_store)
-        handlers = WebHandlers(interface)
-        
         # Mock the client and orchestrator
-        mock_client = MagicMock()
+        mock_client = object()  # placeholder; the orchestrator call is patched
         interface.context._client = mock_client
         
-        # Mock run_bom_pricing_proposal
-        mock_bundle = ProposalBundle(
-            bom_text="E2E BOM",
-            pricing_text="E2E Pricing",
-            proposal_text="E2E Proposal"
-        )
-        
-        with patch("src.interfaces.handlers.run_bom_pricing_proposal", return_value=mock_bundle):
-            with patch("src.interfaces.handlers.end_session_span"):
-                # Generate proposal
-                gen_result = await handlers.handle_generate_proposal(session_id)
+        # Generate proposal
+        gen_result = await handlers.handle_generate_proposal(session_id)
         
         # Verify generation succeeded
         assert "error" not in gen_result
-        assert gen_result["bom"] == "E2E BOM"
+        assert gen_result["bom"] == "Test BOM"
         
         # Retrieve stored proposal
         retrieve_result = handlers.handle_get_proposal(session_id)
         
         # Verify retrieval succeeded
         assert "error" not in retrieve_result
-        assert retrieve_result["bom"] == "E2E BOM"
-        assert retrieve_result["pricing"] == "E2E Pricing"
-        assert retrieve_result["proposal"] == "E2E Proposal"
+        assert retrieve_result["bom"] == "Test BOM"
+        assert retrieve_result["pricing"] == "Test Pricing"
+        assert retrieve_result["proposal"] == "Test Proposal"
 
 
 if __name__ == "__main__":
@@ -3,13 +3,17 @@
 import pytest
 from flask import Flask
 from flask.testing import FlaskClient
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock
 
 from src.core.session import InMemorySessionStore
 from src.core.models import SessionData, ProposalBundle
 from src.web.interface import WebInterface
 from src.web.handlers import WebHandlers
 
+# Placeholder agent thread; no test here calls into it.
+_THREAD_SENTINEL = object()
+_PROPOSAL = ProposalBundle(bom_text="BOM", pricing_text="Pricing", proposal_text="Proposal")
+
 
 @pytest.fixture
 def app():
@@ -28,9 +32,12 @@ def client(app):
     return app.test_client()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def session_store():
-    """Create a session store with test data."""
+    """Create a session store with test data.
+
+    The endpoint tests only read from the store, so it is built once per module.
+    """
     store = InMemorySessionStore()
     
     # Session 1 with proposal
@@ -40,7 +47,7 @@ def session_store():
         proposal_text="Proposal for session 1"
     )
     session1 = SessionData(
-        thread=MagicMock(),
+        thread=_THREAD_SENTINEL,
         history=[],
         turn_count=5,
         bom_items=[{"serviceName": "VM", "sku": "D2s_v3"}],
@@ -55,7 +62,7 @@ def session_store():
         proposal_text="Proposal for session 2"
     )
     session2 = SessionData(
-        thread=MagicMock(),
+        thread=_THREAD_SENTINEL,
         history=[],
         turn_count=3,
         bom_items=[{"serviceName": "App Service", "sku": "P1v2"}],
@@ -65,7 +72,7 @@ def session_store():
     
     # Session 3 without proposal (should not be included)
     session3 = SessionData(
-        thread=MagicMock(),
+        thread=_THREAD_SENTINEL,
         history=[],
         turn_count=1,
         bom_items=[],
@@ -76,24 +83,39 @@ def session_store():
     return store
 
 
+@pytest.fixture(scope="module")
+def empty_session_store():
+    """Create a session store with no sessions."""
+    return InMemorySessionStore()
+
+
+@pytest.fixture
+def use_session_store(app, monkeypatch):
+    """Point the app's handlers at a session store for the duration of a test."""
+    from src.web.app import handlers
+
+    def install(store):
+        monkeypatch.setattr(handlers.interface.context, "session_store", store)
+
+    return install
+
+
 class TestProposalsEndpoint:
     """Test /api/proposals endpoint."""
 
-    def test_get_all_proposals_returns_200(self, client, session_store, app):
+    def test_get_all_proposals_returns_200(self, client, session_store, use_session_store, app):
         """Test that /api/proposals returns HTTP 200 OK."""
         # Replace the session store in the app
         with app.app_context():
-            from src.web.app import handlers
-            handlers.interface.context.session_store = session_store
+            use_session_store(session_store)
             
             response = client.get('/api/proposals')
             assert response.status_code == 200
 
-    def test_get_all_proposals_returns_correct_count(self, client, session_store, app):
+    def test_get_all_proposals_returns_correct_count(self, client, session_store, use_session_store, app):
         """Test that /api/proposals returns correct proposal count."""
         with app.app_context():
-            from src.web.app import handlers
-            handlers.interface.context.session_store = session_store
+            use_session_store(session_store)
             
             response = client.get('/api/proposals')
             data = response.get_json()
@@ -101,11 +123,10 @@ class TestProposalsEndpoint:
             assert data['count'] == 2  # Only 2 sessions have proposals
             assert len(data['proposals']) == 2
 
-    def test_get_all_proposals_contains_session_ids(self, client, session_store, app):
+    def test_get_all_proposals_contains_session_ids(self, client, session_store, use_session_store, app):
         """Test that proposals include session IDs."""
         with app.app_context():
-            from src.web.app import handlers
-            handlers.interface.context.session_store = session_store
+            use_session_store(session_store)
             
             response = client.get('/api/proposals')
             data = response.get_json()
@@ -115,11 +136,10 @@ class TestProposalsEndpoint:
             assert 'session2' in session_ids
             assert 'session3' not in session_ids  # No proposal
 
-    def test_get_all_proposals_contains_proposal_data(self, client, session_store, app):
+    def test_get_all_proposals_contains_proposal_data(self, client, session_store, use_session_store, app):
         """Test that proposals contain bom, pricing, and proposal text."""
         with app.app_context():
-            from src.web.app import handlers
-            handlers.interface.context.session_store = session_store
+            use_session_store(session_store)
             
             response = client.get('/api/proposals')
             data = response.get_json()
@@ -135,13 +155,10 @@ class TestProposalsEndpoint:
                 assert len(proposal['pricing']) > 0
                 assert len(proposal['proposal']) > 0
 
-    def test_get_all_proposals_with_empty_store(self, client, app):
+    def test_get_all_proposals_with_empty_store(self, client, empty_session_store, use_session_store, app):
         """Test /api/proposals with no proposals stored."""
-        empty_store = InMemorySessionStore()
-        
         with app.app_context():
-            from src.web.app import handlers
-            handlers.interface.context.session_store = empty_store
+            use_session_store(empty_session_store)
             
             response = client.get('/api/proposals')
             data = response.get_json()
@@ -150,11 +167,10 @@ class TestProposalsEndpoint:
             assert data['count'] == 0
             assert data['proposals'] == []
 
-    def test_get_all_proposals_excludes_sessions_without_proposals(self, client, session_store, app):
+    def test_get_all_proposals_excludes_sessions_without_proposals(self, client, session_store, use_session_store, app):
         """Test that only sessions with proposals are included."""
         with app.app_context():
-            from src.web.app import handlers
-            handlers.interface.context.session_store = session_store
+            use_session_store(session_store)
             
             response = client.get('/api/proposals')
             data = response.get_json()
@@ -179,11 +195,11 @@ class TestSessionStoreGetAllWithProposals:
         
         # Add session with proposal
         proposal1 = ProposalBundle(bom_text="BOM1", pricing_text="Price1", proposal_text="Prop1")
-        session1 = SessionData(thread=MagicMock(), history=[], proposal=proposal1)
+        session1 = SessionData(thread=_THREAD_SENTINEL, history=[], proposal=proposal1)
         store.set("has_proposal", session1)
         
         # Add session without proposal
-        session2 = SessionData(thread=MagicMock(), history=[], proposal=None)
+        session2 = SessionData(thread=_THREAD_SENTINEL, history=[], proposal=None)
         store.set("no_proposal", session2)
         
         result = store.get_all_with_proposals()
@@ -196,8 +212,8 @@ class TestSessionStoreGetAllWithProposals:
         """Test method returns empty dict when no proposals exist."""
         store = InMemorySessionStore()
         
-        session1 = SessionData(thread=MagicMock(), history=[], proposal=None)
-        session2 = SessionData(thread=MagicMock(), history=[], proposal=None)
+        session1 = SessionData(thread=_THREAD_SENTINEL, history=[], proposal=None)
+        session2 = SessionData(thread=_THREAD_SENTINEL, history=[], proposal=None)
         store.set("session1", session1)
         store.set("session2", session2)
         
@@ -210,9 +226,30 @@ class TestSessionStoreGetAllWithProposals:
         store = InMemorySessionStore()
         
         result = store.get_all_with_proposals()
-        
+
         assert result == {}
 
+    def test_get_all_with_proposals_spans_all_shards(self):
+        """Test method collects proposals from every shard under concurrent writes."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        store = InMemorySessionStore(shard_count=4)
+        proposal = ProposalBundle(bom_text="BOM", pricing_text="Price", proposal_text="Prop")
+
+        def add_session(i):
+            store.set(
+                f"session{i}",
+                SessionData(thread=None, history=[], proposal=proposal if i % 2 else None),
+            )
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(add_session, range(64)))
+
+        result = store.get_all_with_proposals()
+
+        assert len(result) == 32
+        assert all(int(sid[len("session"):]) % 2 for sid in result)
+
 
 class TestWebHandlersGetAllProposals:
     """Test WebHandlers.handle_get_all_proposals method."""
@@ -226,7 +263,7 @@ class TestWebHandlersGetAllProposals:
             proposal_text="Test Proposal"
         )
         session_data = SessionData(
-            thread=MagicMock(),
+            thread=_THREAD_SENTINEL,
             history=[],
             proposal=proposal
         )
@@ -251,7 +288,7 @@ class TestWebHandlersGetAllProposals:
             proposal_text="Test Proposal"
         )
         session_data = SessionData(
-            thread=MagicMock(),
+            thread=_THREAD_SENTINEL,
             history=[],
             proposal=proposal
         )
@@ -279,3 +316,57 @@ class TestWebHandlersGetAllProposals:
         assert result['proposals'] == []
         assert result['count'] == 0
         assert 'error' not in result
+
+    @pytest.mark.asyncio
+    async def test_handle_get_all_proposals_cached_until_generation(self):
+        """Test handler reuses its payload until a proposal is generated."""
+        session_store = InMemorySessionStore()
+        proposal = ProposalBundle(bom_text="BOM", pricing_text="Pricing", proposal_text="Proposal")
+        session_store.set("first", SessionData(thread=_THREAD_SENTINEL, history=[], proposal=proposal))
+
+        web_interface = WebInterface(session_store)
+        web_interface.generate_proposal = AsyncMock(
+            return_value={"bom": "BOM", "pricing": "Pricing", "proposal": "Proposal"}
+        )
+        handlers = WebHandlers(web_interface)
+
+        first = handlers.handle_get_all_proposals()
+        session_store.set("second", SessionData(thread=_THREAD_SENTINEL, history=[], proposal=proposal))
+
+        cached = handlers.handle_get_all_proposals()
+        assert cached == first
+        assert cached is not first and cached["proposals"][0] is not first["proposals"][0]
+
+        await handlers.handle_generate_proposal("second")
+
+        assert handlers.handle_get_all_proposals()["count"] == 2
+
+    def test_handle_get_all_proposals_cache_expires(self, monkeypatch):
+        """Test the cached payload is rebuilt once it is older than the TTL."""
+        import src.web.handlers as handlers_module
+
+        session_store = InMemorySessionStore()
+        handlers = WebHandlers(WebInterface(session_store))
+        assert handlers.handle_get_all_proposals()["count"] == 0
+
+        session_store.set("first", SessionData(thread=_THREAD_SENTINEL, history=[], proposal=_PROPOSAL))
+        monkeypatch.setattr(handlers_module, "_ALL_PROPOSALS_CACHE_TTL_SECONDS", 0.0)
+
+        assert handlers.handle_get_all_proposals()["count"] == 1
+
+    def test_handle_get_all_proposals_not_cached_for_shared_store(self):
+        """Test stores shared across workers are read on every request."""
+        store = InMemorySessionStore()
+
+        class SharedStore:
+            def get_all_with_proposals(self):
+                return store.get_all_with_proposals()
+
+        web_interface = WebInterface(store)
+        web_interface.context.session_store = SharedStore()
+        handlers = WebHandlers(web_interface)
+        assert handlers.handle_get_all_proposals()["count"] == 0
+
+        store.set("first", SessionData(thread=_THREAD_SENTINEL, history=[], proposal=_PROPOSAL))
+
+        assert handlers.handle_get_all_proposals()["count"] == 1
@@ -1,16 +1,36 @@
 """Integration test for retrieving multiple proposals workflow."""
 
 import pytest
-from unittest.mock import MagicMock
 
 from src.core.session import InMemorySessionStore
 from src.core.models import SessionData, ProposalBundle
 
+# Placeholder agent thread; no test here calls into it.
+_THREAD_SENTINEL = object()
+_SAMPLE_PROPOSAL = ProposalBundle(bom_text="BOM", pricing_text="Pricing", proposal_text="Proposal")
+
+
+@pytest.fixture
+def make_session():
+    """Build SessionData around the shared placeholder thread."""
+
+    def _make(proposal=None, history=None, bom_items=None):
+        history = history or []
+        return SessionData(
+            thread=_THREAD_SENTINEL,
+            history=history,
+            turn_count=len(history),
+            bom_items=bom_items or [],
+            proposal=proposal,
+        )
+
+    return _make
+
 
 class TestRetrieveProposalsWorkflow:
     """Test workflow for retrieving multiple proposals."""
 
-    def test_workflow_complete_proposal_generation_and_retrieval(self):
+    def test_workflow_complete_proposal_generation_and_retrieval(self, make_session):
         """
         Test the complete workflow:
         1. Generate a proposal for session 1
@@ -27,14 +47,12 @@ class TestRetrieveProposalsWorkflow:
             pricing_text="# Pricing Estimate\nTotal Monthly: $100.00",
             proposal_text="# Proposal for Web Application\nYour web app solution..."
         )
-        session1 = SessionData(
-            thread=MagicMock(),
+        session1 = make_session(
             history=[
                 {"role": "user", "content": "I need a web application"},
                 {"role": "assistant", "content": "What region?"},
                 {"role": "user", "content": "East US"},
             ],
-            turn_count=3,
             bom_items=[
                 {
                     "serviceName": "Azure App Service",
@@ -55,14 +73,12 @@ class TestRetrieveProposalsWorkflow:
             pricing_text="# Pricing Estimate\nTotal Monthly: $200.00",
             proposal_text="# Proposal for Database Solution\nYour database solution..."
         )
-        session2 = SessionData(
-            thread=MagicMock(),
+        session2 = make_session(
             history=[
                 {"role": "user", "content": "I need a SQL database"},
                 {"role": "assistant", "content": "What tier?"},
                 {"role": "user", "content": "Standard S3 in West US"},
             ],
-            turn_count=3,
             bom_items=[
                 {
                     "serviceName": "Azure SQL Database",
@@ -78,13 +94,10 @@ class TestRetrieveProposalsWorkflow:
         session_store.set("database_session", session2)
         
         # Session 3: Active session without proposal (should not be included)
-        session3 = SessionData(
-            thread=MagicMock(),
+        session3 = make_session(
             history=[
                 {"role": "user", "content": "I need help with Azure costs"},
             ],
-            turn_count=1,
-            bom_items=[],
             proposal=None,  # No proposal yet
         )
         session_store.set("active_session", session3)
@@ -111,7 +124,7 @@ class TestRetrieveProposalsWorkflow:
         assert "$200.00" in db_proposal.pricing_text
         assert "database solution" in db_proposal.proposal_text.lower()
 
-    def test_workflow_start_new_session_after_viewing_proposals(self):
+    def test_workflow_start_new_session_after_viewing_proposals(self, make_session):
         """
         Test workflow:
         1. View all proposals (2 exist)
@@ -128,13 +141,7 @@ class TestRetrieveProposalsWorkflow:
                 pricing_text=f"Pricing {i}",
                 proposal_text=f"Proposal {i}",
             )
-            session = SessionData(
-                thread=MagicMock(),
-                history=[],
-                turn_count=0,
-                proposal=proposal,
-            )
-            session_store.set(f"session_{i}", session)
+            session_store.set(f"session_{i}", make_session(proposal=proposal))
         
         # Verification: Initially 2 proposals
         initial_proposals = session_store.get_all_with_proposals()
@@ -146,13 +153,7 @@ class TestRetrieveProposalsWorkflow:
             pricing_text="Pricing 3",
             proposal_text="Proposal 3",
         )
-        session3 = SessionData(
-            thread=MagicMock(),
-            history=[],
-            turn_count=0,
-            proposal=proposal3,
-        )
-        session_store.set("session_3", session3)
+        session_store.set("session_3", make_session(proposal=proposal3))
         
         # Verification: Now 3 proposals
         updated_proposals = session_store.get_all_with_proposals()
@@ -161,25 +162,28 @@ class TestRetrieveProposalsWorkflow:
         assert "session_2" in updated_proposals
         assert "session_3" in updated_proposals
 
-    def test_workflow_empty_proposals_list(self):
+    @pytest.mark.parametrize(
+        "has_proposal, expected_count",
+        [
+            ([False, False, False], 0),
+            ([True, False, True], 2),
+            ([True, True, True], 3),
+        ],
+        ids=["none", "mixed", "all"],
+    )
+    def test_workflow_proposal_count(self, make_session, has_proposal, expected_count):
         """
-        Test workflow with no proposals:
-        1. Query all proposals when none exist
-        2. Verify empty list is returned (not an error)
+        Test workflow:
+        1. Store sessions with and without proposals
+        2. Query all proposals
+        3. Verify only sessions with proposals are returned (empty dict, not an error, when none)
         """
         session_store = InMemorySessionStore()
-        
-        # Setup: Sessions without proposals
-        for i in range(1, 4):
-            session = SessionData(
-                thread=MagicMock(),
-                history=[],
-                turn_count=0,
-                proposal=None,  # No proposals
-            )
-            session_store.set(f"session_{i}", session)
-        
-        # Action & Verification: Get all proposals returns empty
+        for i, with_proposal in enumerate(has_proposal, start=1):
+            session_store.set(f"session_{i}", make_session(proposal=_SAMPLE_PROPOSAL if with_proposal else None))
+
         proposals = session_store.get_all_with_proposals()
-        assert proposals == {}
-        assert len(proposals) == 0
+
+        assert isinstance(proposals, dict)
+        assert len(proposals) == expected_count
+        assert all(data.proposal is _SAMPLE_PROPOSAL for data in proposals.values())
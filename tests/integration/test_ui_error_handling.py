@@ -10,6 +10,16 @@ from src.web.interface import WebInterface
 from src.web.handlers import WebHandlers
 
 
+def _event_stream(*events):
+    """Build a stand-in for handle_generate_proposal_stream that yields the given events."""
+
+    async def stream(session_id):
+        for event in events:
+            yield event
+
+    return stream
+
+
 @pytest.fixture
 def client():
     """Flask test client."""
@@ -18,6 +28,36 @@ def client():
         yield client
 
 
+@pytest.fixture
+def session_client(client):
+    """Flask test client with an active session."""
+    with client.session_transaction() as sess:
+        sess['session_id'] = 'test-session'
+    return client
+
+
+@pytest.fixture
+def failing_handler(request):
+    """Patch a web handler to raise; parametrize indirectly with (handler name, exception)."""
+    name, error = request.param
+    with patch(f'src.web.app.handlers.{name}', new_callable=AsyncMock, side_effect=error):
+        yield error
+
+
+@pytest.fixture(scope="module")
+def index_page():
+    """Render the index page once; its HTML is the same for every UI test."""
+    flask_app.config['TESTING'] = True
+    with flask_app.test_client() as client:
+        return client.get('/')
+
+
+@pytest.fixture(scope="module")
+def index_html(index_page):
+    """Decoded HTML of the index page."""
+    return index_page.get_data(as_text=True)
+
+
 @pytest.fixture
 def session_store():
     """Create a fresh session store."""
@@ -39,35 +79,24 @@ def handlers(web_interface):
 class TestChatErrorHandling:
     """Tests for chat endpoint error handling."""
     
-    def test_chat_returns_error_on_exception(self, client):
-        """Chat endpoint should return 500 with error message on exception."""
-        with client.session_transaction() as sess:
-            sess['session_id'] = 'test-session'
-        
-        # Mock the handler to raise an exception
-        with patch('src.web.app.handlers.handle_chat', new_callable=AsyncMock) as mock_handle:
-            mock_handle.side_effect = Exception("Test error")
-            
-            response = client.post('/api/chat', json={'message': 'test'})
-            
-            assert response.status_code == 500
-            data = response.get_json()
-            assert 'error' in data
-            assert 'Test error' in data['error']
-    
-    def test_chat_handles_network_timeout(self, client):
-        """Chat endpoint should handle timeout errors gracefully."""
-        with client.session_transaction() as sess:
-            sess['session_id'] = 'test-session'
+    @pytest.mark.parametrize(
+        "failing_handler",
+        [
+            ("handle_chat", Exception("Test error")),
+            ("handle_chat", TimeoutError("Request timed out")),
+            ("handle_chat", Exception("Backend service unavailable")),
+        ],
+        ids=["exception", "timeout", "backend-unavailable"],
+        indirect=True,
+    )
+    def test_chat_returns_error_on_exception(self, session_client, failing_handler):
+        """Chat endpoint should return 500 with the error message on exception."""
+        response = session_client.post('/api/chat', json={'message': 'test'})
         
-        with patch('src.web.app.handlers.handle_chat', new_callable=AsyncMock) as mock_handle:
-            mock_handle.side_effect = TimeoutError("Request timed out")
-            
-            response = client.post('/api/chat', json={'message': 'test'})
-            
-            assert response.status_code == 500
-            data = response.get_json()
-            assert 'error' in data
+        assert response.status_code == 500
+        data = response.get_json()
+        assert 'error' in data
+        assert str(failing_handler) in data['error']
     
     def test_chat_handles_json_decode_error(self, client):
         """Chat endpoint should handle malformed JSON gracefully."""
@@ -93,19 +122,18 @@ class TestProposalGenerationErrorHandling:
         assert 'error' in data
         assert 'session' in data['error'].lower()
     
-    def test_generate_proposal_handles_exception(self, client):
+    @pytest.mark.parametrize(
+        "failing_handler",
+        [("handle_generate_proposal", Exception("Proposal generation failed"))],
+        indirect=True,
+    )
+    def test_generate_proposal_handles_exception(self, session_client, failing_handler):
         """Generate proposal should return 500 on exception."""
-        with client.session_transaction() as sess:
-            sess['session_id'] = 'test-session'
+        response = session_client.post('/api/generate-proposal')
         
-        with patch('src.web.app.handlers.handle_generate_proposal', new_callable=AsyncMock) as mock_handle:
-            mock_handle.side_effect = Exception("Proposal generation failed")
-            
-            response = client.post('/api/generate-proposal')
-            
-            assert response.status_code == 500
-            data = response.get_json()
-            assert 'error' in data
+        assert response.status_code == 500
+        data = response.get_json()
+        assert 'error' in data
     
     def test_generate_proposal_stream_without_session(self, client):
         """Generate proposal stream should return 400 without session."""
@@ -119,19 +147,18 @@ class TestProposalGenerationErrorHandling:
 class TestResetErrorHandling:
     """Tests for reset endpoint error handling."""
     
-    def test_reset_handles_exception(self, client):
+    @pytest.mark.parametrize(
+        "failing_handler",
+        [("handle_reset", Exception("Reset failed"))],
+        indirect=True,
+    )
+    def test_reset_handles_exception(self, session_client, failing_handler):
         """Reset endpoint should return 500 on exception."""
-        with client.session_transaction() as sess:
-            sess['session_id'] = 'test-session'
+        response = session_client.post('/api/reset')
         
-        with patch('src.web.app.handlers.handle_reset', new_callable=AsyncMock) as mock_handle:
-            mock_handle.side_effect = Exception("Reset failed")
-            
-            response = client.post('/api/reset')
-            
-            assert response.status_code == 500
-            data = response.get_json()
-            assert 'error' in data
+        assert response.status_code == 500
+        data = response.get_json()
+        assert 'error' in data
     
     def test_reset_succeeds_without_session(self, client):
         """Reset should succeed even without active session."""
@@ -178,83 +205,47 @@ class TestHandlerErrorHandling:
 class TestHTMLErrorElements:
     """Tests for HTML error UI elements."""
     
-    def test_index_page_contains_error_banner(self, client):
+    def test_index_page_contains_error_banner(self, index_page, index_html):
         """Index page should contain error banner element."""
-        response = client.get('/')
-        
-        assert response.status_code == 200
-        html = response.data.decode('utf-8')
-        assert 'id="errorBanner"' in html
-        assert 'error-banner' in html
+        assert index_page.status_code == 200
+        assert 'id="errorBanner"' in index_html
+        assert 'error-banner' in index_html
     
-    def test_index_page_contains_error_styling(self, client):
+    def test_index_page_contains_error_styling(self, index_html):
         """Index page should contain error message styling."""
-        response = client.get('/')
-        
-        assert response.status_code == 200
-        html = response.data.decode('utf-8')
-        assert '.error-banner' in html
-        assert '.error-message' in html
-        assert 'slideDown' in html  # Animation
+        assert '.error-banner' in index_html
+        assert '.error-message' in index_html
+        assert 'slideDown' in index_html  # Animation
     
-    def test_index_page_contains_error_handlers(self, client):
+    def test_index_page_contains_error_handlers(self, index_html):
         """Index page should contain JavaScript error handling functions."""
-        response = client.get('/')
-        
-        assert response.status_code == 200
-        html = response.data.decode('utf-8')
-        assert 'showErrorBanner' in html
-        assert 'hideErrorBanner' in html
-        assert 'addErrorMessage' in html
-        assert 'retryLastMessage' in html
+        assert 'showErrorBanner' in index_html
+        assert 'hideErrorBanner' in index_html
+        assert 'addErrorMessage' in index_html
+        assert 'retryLastMessage' in index_html
 
 
 class TestErrorMessageFormatting:
     """Tests for error message structure and formatting."""
     
-    def test_index_page_error_message_has_icon(self, client):
+    def test_index_page_error_message_has_icon(self, index_html):
         """Error messages should include icon element."""
-        response = client.get('/')
-        html = response.data.decode('utf-8')
-        
-        assert 'error-message-icon' in html
+        assert 'error-message-icon' in index_html
     
-    def test_index_page_error_message_has_title_and_detail(self, client):
+    def test_index_page_error_message_has_title_and_detail(self, index_html):
         """Error messages should have title and detail elements."""
-        response = client.get('/')
-        html = response.data.decode('utf-8')
-        
-        assert 'error-message-title' in html
-        assert 'error-message-detail' in html
+        assert 'error-message-title' in index_html
+        assert 'error-message-detail' in index_html
     
-    def test_index_page_has_retry_button_styling(self, client):
+    def test_index_page_has_retry_button_styling(self, index_html):
         """Error messages should have retry button styling."""
-        response = client.get('/')
-        html = response.data.decode('utf-8')
-        
-        assert '.retry-button' in html
-        assert 'retry-button:hover' in html
+        assert '.retry-button' in index_html
+        assert 'retry-button:hover' in index_html
 
 
 class TestErrorHandlingIntegration:
     """Integration tests for error handling workflow."""
     
-    def test_chat_error_flow(self, client):
-        """Test complete error handling flow for chat errors."""
-        with client.session_transaction() as sess:
-            sess['session_id'] = 'test-session'
-        
-        # Simulate backend error
-        with patch('src.web.app.handlers.handle_chat', new_callable=AsyncMock) as mock_handle:
-            mock_handle.side_effect = Exception("Backend service unavailable")
-            
-            response = client.post('/api/chat', json={'message': 'test'})
-            
-            assert response.status_code == 500
-            data = response.get_json()
-            assert 'error' in data
-            assert len(data['error']) > 0
-    
     def test_proposal_stream_error_format(self, client):
         """Test error format for streaming proposal generation."""
         with client.session_transaction() as sess:
@@ -271,33 +262,47 @@ class TestErrorHandlingIntegration:
         session_store.set('test-session', session_data)
         
         # Mock the streaming handler to yield error
-        async def mock_stream_error(session_id):
-            yield {"event_type": "error", "message": "Stream failed"}
+        stream_error = _event_stream({"event_type": "error", "message": "Stream failed"})
         
-        with patch('src.web.app.handlers.handle_generate_proposal_stream', mock_stream_error):
+        with patch('src.web.app.handlers.handle_generate_proposal_stream', stream_error):
             response = client.get('/api/generate-proposal-stream')
             
             assert response.status_code == 200  # SSE returns 200 even on errors
             assert response.content_type == 'text/event-stream; charset=utf-8'
 
+    def test_proposal_stream_disables_buffering(self, client):
+        """Test SSE response opts out of proxy buffering and delivers every event."""
+        with client.session_transaction() as sess:
+            sess['session_id'] = 'test-session'
+
+        stream = _event_stream(
+            {"event_type": "agent_start", "agent_name": "pricing_agent"},
+            {"event_type": "agent_progress", "message": "chunk"},
+            {"event_type": "workflow_complete", "message": "done"},
+        )
+
+        with patch('src.web.app.handlers.handle_generate_proposal_stream', stream):
+            response = client.get('/api/generate-proposal-stream')
+            body = response.data.decode('utf-8')
+
+        assert response.headers['Cache-Control'] == 'no-cache'
+        assert response.headers['X-Accel-Buffering'] == 'no'
+        assert response.headers['Content-Encoding'] == 'identity'
+        assert body.count('data: ') == 3
+        assert 'workflow_complete' in body
+
 
 class TestErrorBannerBehavior:
     """Tests for error banner UI behavior."""
     
-    def test_error_banner_has_close_button(self, client):
+    def test_error_banner_has_close_button(self, index_html):
         """Error banner should have close button."""
-        response = client.get('/')
-        html = response.data.decode('utf-8')
-        
-        assert 'error-banner-close' in html
-        assert 'hideErrorBanner()' in html
+        assert 'error-banner-close' in index_html
+        assert 'hideErrorBanner()' in index_html
     
-    def test_error_banner_animation(self, client):
+    def test_error_banner_animation(self, index_html):
         """Error banner should have slide down animation."""
-        response = client.get('/')
-        html = response.data.decode('utf-8')
-        
-        assert '@keyframes slideDown' in html
+        assert '@keyframes slideDown' in index_html
 
 
 if __name__ == '__main__':
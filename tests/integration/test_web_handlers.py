@@ -1,9 +1,15 @@
 """Tests for Web handlers and API endpoints."""
 
 import asyncio
+import time
+from datetime import datetime
+
 import pytest
+from flask import Flask
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from src.core.models import SessionData
+from src.interfaces.context import InterfaceContext
 from src.web.handlers import WebHandlers
 from src.web.interface import WebInterface
 from src.core.session import InMemorySessionStore
@@ -92,6 +98,41 @@ class TestWebHandlersChatEndpoint:
 
         assert result["response"] == original_response
 
+    @pytest.mark.asyncio
+    async def test_handle_chat_reuses_interface_result(self):
+        """Test that the interface payload is returned without rebuilding it."""
+        mock_interface = AsyncMock(spec=WebInterface)
+        payload = {
+            "response": "Which region?",
+            "is_done": False,
+            "bom_items": [],
+            "pricing_total": 0.0,
+            "error": None,
+        }
+        mock_interface.chat_turn.return_value = payload
+
+        handlers = WebHandlers(mock_interface)
+        result = await handlers.handle_chat("session1", "East US")
+
+        assert result is payload
+        assert result["pricing_total"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_handle_chat_strips_fenced_json_keeps_prose(self):
+        """Test that fenced JSON is removed while surrounding prose is kept."""
+        mock_interface = AsyncMock(spec=WebInterface)
+        mock_interface.chat_turn.return_value = {
+            "response": "Here is your summary.\n```JSON\n{\"done\": true}\n```\n",
+            "is_done": True,
+            "bom_items": [],
+            "error": None,
+        }
+
+        handlers = WebHandlers(mock_interface)
+        result = await handlers.handle_chat("session1", "Done")
+
+        assert result["response"] == "Here is your summary."
+
 
 class TestWebHandlersProposalEndpoint:
     """Test proposal generation endpoint handler."""
@@ -427,13 +468,187 @@ class TestWebHandlerErrorHandling:
         assert result["response"] is None or result["response"] == ""
 
 
+class TestWebInterfaceChatTurn:
+    """Test WebInterface chat turn payload assembly."""
+
+    @pytest.mark.asyncio
+    async def test_chat_turn_reuses_session_from_turn_result(self):
+        """Test pricing fields come from the turn's session without a second store read."""
+        store = InMemorySessionStore()
+        interface = WebInterface(store)
+        session_data = SessionData(
+            thread=None, history=[], pricing_total=12.5, pricing_task_status="complete"
+        )
+        interface.handler.handle_chat_turn_with_session = AsyncMock(
+            return_value=({"response": "Which region?", "is_done": False}, session_data)
+        )
+
+        with patch.object(InterfaceContext, "__aenter__", AsyncMock(return_value=interface.context)), \
+             patch.object(InterfaceContext, "__aexit__", AsyncMock(return_value=None)), \
+             patch.object(store, "get", wraps=store.get) as spy_get:
+            result = await interface.chat_turn("session1", "Hello")
+
+        assert result["pricing_total"] == 12.5
+        spy_get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_chat_turn_omits_pricing_before_pricing_starts(self):
+        """Test early turns skip pricing fields while pricing is untouched."""
+        interface = WebInterface(InMemorySessionStore())
+        session_data = SessionData(thread=None, history=[])
+        interface.handler.handle_chat_turn_with_session = AsyncMock(
+            side_effect=lambda *args: ({"response": "Which region?", "is_done": False}, session_data)
+        )
+
+        with patch.object(InterfaceContext, "__aenter__", AsyncMock(return_value=interface.context)), \
+             patch.object(InterfaceContext, "__aexit__", AsyncMock(return_value=None)):
+            early = await interface.chat_turn("session1", "Hello")
+            session_data.pricing_task_status = "queued"
+            queued = await interface.chat_turn("session1", "East US")
+
+        assert not any(key.startswith("pricing_") for key in early)
+        assert queued["pricing_task_status"] == "queued"
+        assert queued["pricing_items"] == []
+
+    @pytest.mark.asyncio
+    async def test_concurrent_turns_use_separate_contexts(self):
+        """Test overlapping turns each enter their own context, never the shared one."""
+        interface = WebInterface(InMemorySessionStore())
+        seen = []
+        release = asyncio.Event()
+
+        async def fake_turn(ctx, session_id, message):
+            seen.append(ctx)
+            await release.wait()
+            return {"response": "ok", "is_done": False}, None
+
+        async def fake_enter(ctx):
+            return ctx
+
+        interface.handler.handle_chat_turn_with_session = fake_turn
+        with patch.object(InterfaceContext, "__aenter__", fake_enter), \
+             patch.object(InterfaceContext, "__aexit__", AsyncMock(return_value=None)):
+            turns = [
+                asyncio.create_task(interface.chat_turn("session1", "A")),
+                asyncio.create_task(interface.chat_turn("session2", "B")),
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            await asyncio.gather(*turns)
+
+        assert seen[0] is not seen[1]
+        assert interface.context not in seen
+        assert all(ctx.session_store is interface.context.session_store for ctx in seen)
+
+    @pytest.mark.asyncio
+    async def test_proposal_stream_uses_its_own_context(self):
+        """Test the streaming proposal path does not enter the shared context."""
+        store = InMemorySessionStore()
+        store.set("session1", SessionData(thread=None, history=[]))
+        interface = WebInterface(store)
+        seen = []
+
+        async def fake_enter(ctx):
+            seen.append(ctx)
+            return ctx
+
+        async def fake_stream(client, requirements, bom_items):
+            return
+            yield
+
+        with patch.object(InterfaceContext, "__aenter__", fake_enter), \
+             patch.object(InterfaceContext, "__aexit__", AsyncMock(return_value=None)), \
+             patch("src.web.handlers.run_bom_pricing_proposal_stream", fake_stream):
+            events = [event async for event in WebHandlers(interface).handle_generate_proposal_stream("session1")]
+
+        assert events == []
+        assert len(seen) == 1 and seen[0] is not interface.context
+        assert seen[0].session_store is store
+
+    def test_empty_session_lookups_return_fresh_payloads(self):
+        """Test responses for unknown sessions are new dicts with list fields."""
+        interface = WebInterface(InMemorySessionStore())
+
+        bom = interface.get_bom_items("missing")
+        bom["bom_items"].append({"serviceName": "VM"})
+        pricing = interface.get_pricing_items("missing")
+        pricing["pricing_items"].append({"serviceName": "VM"})
+
+        assert interface.get_bom_items("missing") == {"bom_items": []}
+        assert interface.get_pricing_items("missing")["pricing_items"] == []
+
+    def test_bom_and_pricing_lookups_are_synchronous(self):
+        """Test polling lookups return payloads directly without an event loop."""
+        store = InMemorySessionStore()
+        store.set("session1", SessionData(thread=None, history=[], bom_items=[{"serviceName": "VM"}]))
+        handlers = WebHandlers(WebInterface(store))
+
+        bom = handlers.handle_get_bom("session1")
+        pricing = handlers.handle_get_pricing("missing")
+
+        assert bom["bom_items"] == [{"serviceName": "VM"}]
+        assert pricing["pricing_items"] == []
+
+
+class TestPricingPolling:
+    """Test the pricing fields returned to the polling sidebar."""
+
+    @pytest.mark.parametrize(
+        "overrides, expected",
+        [
+            ({}, {"pricing_task_status": "idle", "pricing_task_error": None, "pricing_last_update": None}),
+            ({"pricing_task_status": "queued"}, {"pricing_task_status": "queued"}),
+            ({"pricing_task_status": "processing"}, {"pricing_task_status": "processing"}),
+            (
+                {"pricing_task_status": "error", "pricing_task_error": "Pricing calculation timed out after 30 seconds"},
+                {"pricing_task_status": "error", "pricing_task_error": "Pricing calculation timed out after 30 seconds"},
+            ),
+            (
+                {
+                    "pricing_task_status": "complete",
+                    "pricing_items": [{"serviceName": "App Service", "monthly_cost": 73.0}],
+                    "pricing_total": 73.0,
+                    "pricing_last_update": datetime(2026, 1, 7, 12, 30),
+                },
+                {
+                    "pricing_task_status": "complete",
+                    "pricing_items": [{"serviceName": "App Service", "monthly_cost": 73.0}],
+                    "pricing_total": 73.0,
+                    "pricing_last_update": datetime(2026, 1, 7, 12, 30),
+                },
+            ),
+        ],
+        ids=["idle", "queued", "processing", "error", "complete"],
+    )
+    def test_get_pricing_reports_session_state(self, overrides, expected):
+        """Test pricing polling mirrors the session's pricing task state."""
+        store = InMemorySessionStore()
+        store.set("session1", SessionData(thread=None, history=[], **overrides))
+        handlers = WebHandlers(WebInterface(store))
+
+        result = handlers.handle_get_pricing("session1")
+
+        assert {key: result[key] for key in expected} == expected
+
+
 class TestHealthEndpoint:
     """Test health check endpoint."""
 
+    def test_app_health_serves_prebuilt_body(self):
+        """Test the application's health route returns the shared JSON body."""
+        from src.web.app import _HEALTH_BODY, app
+
+        with app.test_client() as client:
+            first = client.get('/health')
+            second = client.get('/health')
+
+        assert first.get_json() == {'status': 'healthy'}
+        assert first.data == second.data == _HEALTH_BODY
+        assert first.mimetype == 'application/json'
+
     @pytest.mark.asyncio
     async def test_health_returns_200(self):
         """Test health endpoint returns 200 OK."""
-        from flask import Flask
         
         app = Flask(__name__)
         
@@ -449,7 +664,6 @@ class TestHealthEndpoint:
     @pytest.mark.asyncio
     async def test_health_returns_healthy_status(self):
         """Test health endpoint returns status: healthy in response."""
-        from flask import Flask
         
         app = Flask(__name__)
         
@@ -468,8 +682,6 @@ class TestHealthEndpoint:
     @pytest.mark.asyncio
     async def test_health_responds_quickly(self):
         """Test health endpoint responds quickly (< 100ms)."""
-        import time
-        from flask import Flask
         
         app = Flask(__name__)
         
@@ -479,9 +691,9 @@ class TestHealthEndpoint:
             return jsonify({'status': 'healthy'})
         
         with app.test_client() as client:
-            start = time.time()
+            start = time.perf_counter()
             response = client.get('/health')
-            elapsed = (time.time() - start) * 1000  # Convert to ms
+            elapsed = (time.perf_counter() - start) * 1000  # Convert to ms
             
             assert response.status_code == 200
             assert elapsed < 100  # Should respond in under 100ms
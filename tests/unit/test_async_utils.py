@@ -0,0 +1,34 @@
+"""Tests for the sync-to-async bridge helpers."""
+
+import pytest
+from opentelemetry import trace
+
+from src.shared.async_utils import run_coroutine
+
+
+class TestRunCoroutine:
+    """Tests for run_coroutine."""
+
+    def test_returns_coroutine_result(self):
+        """Should return the value produced by the coroutine."""
+
+        async def answer():
+            return 42
+
+        assert run_coroutine(answer()) == 42
+
+    def test_propagates_current_span(self):
+        """Should run the coroutine with the caller's active span."""
+        span = trace.NonRecordingSpan(
+            trace.SpanContext(trace_id=1, span_id=2, is_remote=False)
+        )
+
+        async def current_span():
+            return trace.get_current_span()
+
+        with trace.use_span(span, end_on_exit=False):
+            assert run_coroutine(current_span()) is span
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
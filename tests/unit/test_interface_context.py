@@ -0,0 +1,59 @@
+"""Tests for InterfaceContext client lifetime management."""
+
+import os
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.interfaces.context import InterfaceContext
+
+
+@pytest.fixture
+def mock_azure():
+    """Patch the credential and client constructors used by InterfaceContext."""
+    with patch.dict(os.environ, {"AZURE_AI_PROJECT_ENDPOINT": "https://example.test"}):
+        with patch("src.interfaces.context.DefaultAzureCredential") as mock_credential, patch(
+            "src.interfaces.context.AzureAIAgentClient"
+        ) as mock_client_class:
+            mock_credential.return_value.close = AsyncMock()
+            mock_client_class.return_value.__aenter__ = AsyncMock()
+            mock_client_class.return_value.__aexit__ = AsyncMock()
+            yield mock_credential, mock_client_class
+
+
+class TestInterfaceContextReuse:
+    """Tests for sharing one client across nested context entries."""
+
+    @pytest.mark.asyncio
+    async def test_nested_entries_share_client(self, mock_azure):
+        """Inner entries reuse the open client and only the outer exit closes it."""
+        mock_credential, mock_client_class = mock_azure
+        context = InterfaceContext()
+
+        async with context:
+            async with context as inner:
+                assert inner.client is mock_client_class.return_value
+            async with context:
+                pass
+            mock_credential.return_value.close.assert_not_awaited()
+
+        assert mock_client_class.call_count == 1
+        mock_credential.return_value.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_sequential_entries_create_fresh_client(self, mock_azure):
+        """Separate top-level entries still open and close their own client."""
+        mock_credential, mock_client_class = mock_azure
+        context = InterfaceContext()
+
+        async with context:
+            pass
+        async with context:
+            pass
+
+        assert mock_client_class.call_count == 2
+        assert mock_credential.return_value.close.await_count == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
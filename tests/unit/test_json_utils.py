@@ -0,0 +1,83 @@
+"""Unit tests for fast JSON encoding helpers and the Flask JSON provider."""
+
+import json
+from datetime import datetime
+
+import pytest
+from flask import Flask, jsonify, request
+
+import src.shared.json_utils as json_utils
+from src.web.json_provider import OrjsonProvider
+
+
+EVENT = {
+    "event_type": "agent_progress",
+    "agent_name": "pricing_agent",
+    "message": "Priced App Service P1v3 in East US: $146.00/mo",
+    "data": None,
+}
+
+
+class TestDumps:
+    """Test JSON serialization used for web responses and SSE frames."""
+
+    def test_dumps_returns_compact_bytes(self):
+        """Should return compact UTF-8 JSON bytes that round-trip."""
+        encoded = json_utils.dumps(EVENT)
+
+        assert isinstance(encoded, bytes)
+        assert b"\n" not in encoded
+        assert json.loads(encoded) == EVENT
+
+    def test_dumps_falls_back_to_stdlib(self, monkeypatch):
+        """Should produce equivalent output when orjson is unavailable."""
+        monkeypatch.setattr(json_utils, "orjson", None)
+
+        encoded = json_utils.dumps(EVENT)
+
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == EVENT
+
+    def test_dumps_preserves_unicode(self, monkeypatch):
+        """Should emit non-ASCII characters as UTF-8 rather than escapes."""
+        monkeypatch.setattr(json_utils, "orjson", None)
+
+        assert json_utils.dumps({"region": "Brésil"}) == '{"region":"Brésil"}'.encode("utf-8")
+
+
+class TestOrjsonProvider:
+    """Test the Flask JSON provider used by the web app."""
+
+    def test_jsonify_round_trips_through_provider(self):
+        """jsonify and request parsing should work with the orjson provider."""
+
+        app = Flask(__name__)
+        app.json = OrjsonProvider(app)
+
+        @app.post("/echo")
+        def echo():
+            return jsonify({"received": request.json, 1: "non-string key"})
+
+        response = app.test_client().post("/echo", json=EVENT)
+
+        assert response.get_json() == {"received": EVENT, "1": "non-string key"}
+
+    def test_falls_back_for_indent(self):
+        """Formatting options orjson lacks should use Flask's default encoder."""
+
+        provider = OrjsonProvider(Flask(__name__))
+
+        assert provider.dumps({"a": 1}, indent=2) == '{\n  "a": 1\n}'
+
+    def test_datetimes_encode_as_iso_on_both_paths(self):
+        """orjson and the fallback encoder should agree on datetime output."""
+
+        provider = OrjsonProvider(Flask(__name__))
+        value = {"at": datetime(2026, 1, 7, 12, 30, 5, 250000)}
+
+        assert provider.loads(provider.dumps(value)) == {"at": "2026-01-07T12:30:05.250000"}
+        assert provider.loads(provider.dumps(value, indent=2)) == {"at": "2026-01-07T12:30:05.250000"}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
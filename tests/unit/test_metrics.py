@@ -9,6 +9,7 @@ from src.shared.metrics import (
     increment_chat_turns,
     increment_proposals_generated,
     increment_errors,
+    flush_metrics,
 )
 
 
@@ -93,6 +94,11 @@ class TestMetricsConfiguration:
 class TestMetricsIncrements:
     """Tests for metrics increment functions."""
 
+    @pytest.fixture(autouse=True)
+    def drain_buffered_increments(self):
+        """Flush increments buffered by earlier tests before swapping counters."""
+        flush_metrics()
+
     def test_increment_chat_turns_when_configured(self):
         """Test chat turns counter is incremented when metrics are configured."""
         import src.shared.metrics as metrics_module
@@ -101,6 +107,7 @@ class TestMetricsIncrements:
         metrics_module._chat_turns_counter = mock_counter
 
         increment_chat_turns("session-123")
+        flush_metrics()
 
         mock_counter.add.assert_called_once_with(1, {"session_id": "session-123"})
 
@@ -121,6 +128,7 @@ class TestMetricsIncrements:
         metrics_module._proposals_counter = mock_counter
 
         increment_proposals_generated("session-123", success=True)
+        flush_metrics()
 
         mock_counter.add.assert_called_once_with(1, {"session_id": "session-123", "success": "True"})
 
@@ -132,6 +140,7 @@ class TestMetricsIncrements:
         metrics_module._proposals_counter = mock_counter
 
         increment_proposals_generated("session-123", success=False)
+        flush_metrics()
 
         mock_counter.add.assert_called_once_with(1, {"session_id": "session-123", "success": "False"})
 
@@ -143,6 +152,7 @@ class TestMetricsIncrements:
         metrics_module._errors_counter = mock_counter
 
         increment_errors("validation_error", session_id="session-123")
+        flush_metrics()
 
         mock_counter.add.assert_called_once_with(1, {"error_type": "validation_error", "session_id": "session-123"})
 
@@ -154,9 +164,59 @@ class TestMetricsIncrements:
         metrics_module._errors_counter = mock_counter
 
         increment_errors("mcp_timeout")
+        flush_metrics()
 
         mock_counter.add.assert_called_once_with(1, {"error_type": "mcp_timeout"})
 
+    def test_increments_are_batched_until_flush(self):
+        """Test repeated increments are buffered and forwarded as one add."""
+        import src.shared.metrics as metrics_module
+
+        mock_counter = MagicMock()
+        metrics_module._chat_turns_counter = mock_counter
+
+        for _ in range(3):
+            increment_chat_turns("session-batch")
+        mock_counter.add.assert_not_called()
+
+        flush_metrics()
+        flush_metrics()
+
+        mock_counter.add.assert_called_once_with(3, {"session_id": "session-batch"})
+
+    def test_flush_collects_increments_from_other_threads(self):
+        """Test increments recorded on worker threads are flushed."""
+        import threading
+        import src.shared.metrics as metrics_module
+
+        mock_counter = MagicMock()
+        metrics_module._errors_counter = mock_counter
+
+        workers = [threading.Thread(target=increment_errors, args=("agent_failure",)) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        flush_metrics()
+
+        mock_counter.add.assert_called_once_with(4, {"error_type": "agent_failure"})
+
+    def test_flush_drops_flushed_session_keys(self):
+        """Test flushed per-session counts are not retained in the buffers."""
+        import src.shared.metrics as metrics_module
+
+        mock_counter = MagicMock()
+        metrics_module._chat_turns_counter = mock_counter
+
+        increment_chat_turns("session-gone")
+        flush_metrics()
+        increment_chat_turns("session-gone")
+        flush_metrics()
+
+        assert mock_counter.add.call_args_list == [call(1, {"session_id": "session-gone"})] * 2
+        assert all(not buffer.counts for buffer in metrics_module._buffers)
+
     def test_increment_errors_when_not_configured(self):
         """Test errors increment is safe when metrics not configured."""
         import src.shared.metrics as metrics_module
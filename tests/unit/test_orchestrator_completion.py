@@ -1,10 +1,19 @@
 """Tests for completion parsing and requirements extraction."""
 
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
 import pytest
 
+import src.core.orchestrator as orchestrator
 from src.core.models import SessionData
 from src.core.orchestrator import (
+    _run_pricing_task_background,
     history_to_requirements,
+    run_question_turn,
+    run_question_turn_with_session,
     parse_question_completion,
     _extract_json_from_code_block,
 )
@@ -135,3 +144,127 @@ def test_session_reset_clears_turn_count():
     # Verify session is gone
     session_data = session_store.get(session_id)
     assert session_data is None
+
+
+@pytest.mark.asyncio
+async def test_pricing_task_timeout_marks_session_error(monkeypatch):
+    """A pricing run exceeding the timeout should leave the session in the error state."""
+    never_finishes = asyncio.Event()
+
+    async def slow_pricing(client, bom_items):
+        await never_finishes.wait()
+
+    monkeypatch.setattr(orchestrator, "PRICING_TASK_TIMEOUT_SECONDS", 0.01)
+    monkeypatch.setattr("src.agents.pricing_agent.calculate_incremental_pricing", slow_pricing)
+    session_store = InMemorySessionStore()
+    session_store.set(
+        "test-session",
+        SessionData(thread=object(), history=[], bom_items=[{"serviceName": "App Service"}]),
+    )
+
+    await _run_pricing_task_background(None, session_store, "test-session")
+
+    session_data = session_store.get("test-session")
+    assert session_data.pricing_task_status == "error"
+    assert session_data.pricing_task_error == "Pricing calculation timed out after 0.01 seconds"
+
+
+@pytest.mark.asyncio
+async def test_pricing_task_records_utc_update_time(monkeypatch):
+    """A completed pricing run should stamp pricing_last_update as aware UTC."""
+
+    async def priced(client, bom_items):
+        return {"pricing_items": [], "total_monthly": 0.0, "currency": "USD"}
+
+    monkeypatch.setattr("src.agents.pricing_agent.calculate_incremental_pricing", priced)
+    session_store = InMemorySessionStore()
+    session_store.set(
+        "test-session",
+        SessionData(thread=object(), history=[], bom_items=[{"serviceName": "App Service"}]),
+    )
+
+    await _run_pricing_task_background(None, session_store, "test-session")
+
+    session_data = session_store.get("test-session")
+    assert session_data.pricing_task_status == "complete"
+    assert session_data.pricing_last_update.utcoffset() == timedelta(0)
+
+
+class _FakeArchitect:
+    """Architect agent stand-in that replies with a fixed response."""
+
+    def __init__(self, text):
+        self.text = text
+
+    def get_new_thread(self):
+        return object()
+
+    async def run_stream(self, message, thread=None):
+        yield SimpleNamespace(text=self.text)
+
+
+@pytest.mark.asyncio
+async def test_unchanged_bom_does_not_restart_pricing(monkeypatch):
+    """Re-reporting the same BOM items should keep the pricing run already started."""
+    response = '"identified_services": [{"serviceName": "App Service", "sku": "P1v3", "armRegionName": "eastus"}]'
+    run_pricing = AsyncMock()
+    monkeypatch.setattr(orchestrator, "create_architect_agent", lambda client: _FakeArchitect(response))
+    monkeypatch.setattr(orchestrator, "_run_pricing_task_background", run_pricing)
+    session_store = InMemorySessionStore()
+
+    await run_question_turn(None, session_store, "test-session", "I need a web app")
+    await session_store.get("test-session").pricing_task_handle
+    await run_question_turn(None, session_store, "test-session", "In East US")
+
+    assert run_pricing.await_count == 1
+
+    session_data = session_store.get("test-session")
+    session_data.pricing_task_status = "error"
+    session_store.set("test-session", session_data)
+    await run_question_turn(None, session_store, "test-session", "Please retry")
+    await session_store.get("test-session").pricing_task_handle
+
+    assert run_pricing.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_question_turn_returns_session_separately(monkeypatch):
+    """The turn payload stays JSON-shaped; the saved session comes back alongside it."""
+    monkeypatch.setattr(orchestrator, "create_architect_agent", lambda client: _FakeArchitect("Which region?"))
+    session_store = InMemorySessionStore()
+
+    result, session_data = await run_question_turn_with_session(
+        None, session_store, "test-session", "I need a web app"
+    )
+
+    assert session_data is session_store.get("test-session")
+    assert set(result) == {
+        "response", "is_done", "requirements_summary", "history", "bom_items", "bom_updated"
+    }
+    assert set(await run_question_turn(None, session_store, "test-session", "East US")) == set(result)
+
+
+@pytest.mark.asyncio
+async def test_history_version_bumps_after_bom_merge(monkeypatch):
+    """Pollers must not see the new version while the BOM still holds the old items."""
+    response = '"identified_services": [{"serviceName": "App Service", "sku": "P1v3", "armRegionName": "eastus"}]'
+    monkeypatch.setattr(orchestrator, "create_architect_agent", lambda client: _FakeArchitect(response))
+    monkeypatch.setattr(orchestrator, "_run_pricing_task_background", AsyncMock())
+    session_store = InMemorySessionStore()
+    session_store.set("test-session", SessionData(thread=object(), history=[]))
+    versions_at_merge = []
+    merge = orchestrator._merge_bom_items
+
+    def recording_merge(existing, new):
+        versions_at_merge.append(session_store.get("test-session").history_version)
+        return merge(existing, new)
+
+    monkeypatch.setattr(orchestrator, "_merge_bom_items", recording_merge)
+
+    _, session_data = await run_question_turn_with_session(
+        None, session_store, "test-session", "I need a web app"
+    )
+    await session_data.pricing_task_handle
+
+    assert versions_at_merge == [0]
+    assert session_data.history_version == 1
@@ -1,7 +1,11 @@
 """Tests for Azure service name normalization and mapping."""
 
 import pytest
-from src.shared.azure_service_names import normalize_service_name, CANONICAL_SERVICE_NAMES
+from src.shared.azure_service_names import (
+    normalize_service_name,
+    CANONICAL_SERVICE_NAMES,
+    get_service_name_hints,
+)
 
 
 class TestServiceNameNormalization:
@@ -122,7 +126,6 @@ class TestServiceNameHints:
 
     def test_get_service_name_hints_returns_string(self):
         """Test that get_service_name_hints returns formatted string."""
-        from src.shared.azure_service_names import get_service_name_hints
         
         hints = get_service_name_hints()
         assert isinstance(hints, str)
@@ -130,7 +133,6 @@ class TestServiceNameHints:
 
     def test_hints_include_categories(self):
         """Test that hints include major service categories."""
-        from src.shared.azure_service_names import get_service_name_hints
         
         hints = get_service_name_hints()
         assert "Compute:" in hints
@@ -140,7 +142,6 @@ class TestServiceNameHints:
 
     def test_hints_include_canonical_names(self):
         """Test that hints include canonical service names."""
-        from src.shared.azure_service_names import get_service_name_hints
         
         hints = get_service_name_hints()
         assert "Virtual Machines" in hints
@@ -150,7 +151,6 @@ class TestServiceNameHints:
 
     def test_hints_include_examples(self):
         """Test that hints include correct vs incorrect examples."""
-        from src.shared.azure_service_names import get_service_name_hints
         
         hints = get_service_name_hints()
         assert "EXAMPLES OF INCORRECT vs CORRECT:" in hints
@@ -0,0 +1,186 @@
+"""Tests for session store backends."""
+
+import pytest
+from unittest.mock import patch
+
+from src.core.models import ProposalBundle, SessionData
+from src.core.session import InMemorySessionStore, MemcachedSessionStore, create_session_store
+
+
+class FakeMemcacheClient:
+    """In-process stand-in for the pymemcache client API used by the store."""
+
+    def __init__(self):
+        self.data = {}
+        self.versions = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def get_many(self, keys):
+        return {key: self.data[key] for key in keys if key in self.data}
+
+    def gets(self, key):
+        return self.data.get(key), self.versions.get(key)
+
+    def set(self, key, value, expire=0, noreply=None):
+        self.data[key] = value
+        self.versions[key] = self.versions.get(key, 0) + 1
+        return True
+
+    def add(self, key, value, expire=0, noreply=None):
+        if key in self.data:
+            return False
+        return self.set(key, value)
+
+    def cas(self, key, value, cas, expire=0, noreply=None):
+        if self.versions.get(key) != cas:
+            return False
+        return self.set(key, value)
+
+    def delete(self, key, noreply=None):
+        self.data.pop(key, None)
+        return True
+
+    def delete_many(self, keys, noreply=None):
+        for key in keys:
+            self.delete(key)
+        return True
+
+
+def _session(with_proposal: bool) -> SessionData:
+    proposal = ProposalBundle(bom_text="BOM", pricing_text="Price", proposal_text="Prop")
+    return SessionData(
+        thread=None,
+        history=[{"role": "user", "content": "I need a web app"}],
+        proposal=proposal if with_proposal else None,
+    )
+
+
+class TestInMemorySessionStore:
+    """Tests for the sharded in-memory session store."""
+
+    def test_proposal_index_tracks_set_and_delete(self):
+        """Listing proposals follows sessions gaining, losing and deleting proposals."""
+        store = InMemorySessionStore(shard_count=4)
+        store.set("with", _session(with_proposal=True))
+        store.set("without", _session(with_proposal=False))
+        store.set("other", _session(with_proposal=True))
+
+        assert set(store.get_all_with_proposals()) == {"with", "other"}
+
+        store.set("other", _session(with_proposal=False))
+        store.set("without", _session(with_proposal=True))
+        store.delete("with")
+
+        assert set(store.get_all_with_proposals()) == {"without"}
+
+        store.clear()
+
+        assert store.get_all_with_proposals() == {}
+
+    def test_update_applies_change_in_place(self):
+        """update() mutates the stored session and skips missing sessions."""
+        store = InMemorySessionStore()
+        store.set("s1", _session(with_proposal=False))
+
+        updated = store.update("s1", lambda data: setattr(data, "pricing_task_status", "complete"))
+
+        assert updated is store.get("s1")
+        assert updated.pricing_task_status == "complete"
+        assert store.update("missing", lambda data: None) is None
+
+
+class TestMemcachedSessionStore:
+    """Tests for the Memcached-backed session store."""
+
+    def test_round_trips_session_data(self):
+        """Stored sessions are returned as equal copies."""
+        store = MemcachedSessionStore(client=FakeMemcacheClient())
+        store.set("s1", _session(with_proposal=False))
+
+        loaded = store.get("s1")
+
+        assert loaded.history == [{"role": "user", "content": "I need a web app"}]
+        assert store.get("missing") is None
+
+    def test_drops_pricing_task_handle(self):
+        """The in-process task handle is not pickled."""
+        store = MemcachedSessionStore(client=FakeMemcacheClient())
+        data = _session(with_proposal=False)
+        data.pricing_task_handle = object()
+
+        store.set("s1", data)
+
+        assert store.get("s1").pricing_task_handle is None
+        assert data.pricing_task_handle is not None
+
+    def test_get_all_with_proposals_uses_index(self):
+        """Only sessions holding proposals are returned, and deletes update the index."""
+        store = MemcachedSessionStore(client=FakeMemcacheClient())
+        store.set("with", _session(with_proposal=True))
+        store.set("without", _session(with_proposal=False))
+        store.set("other", _session(with_proposal=True))
+
+        assert set(store.get_all_with_proposals()) == {"with", "other"}
+
+        store.delete("with")
+
+        assert set(store.get_all_with_proposals()) == {"other"}
+
+    def test_clear_removes_indexed_sessions(self):
+        """Clearing drops indexed sessions and the index itself."""
+        client = FakeMemcacheClient()
+        store = MemcachedSessionStore(client=client)
+        store.set("with", _session(with_proposal=True))
+
+        store.clear()
+
+        assert store.get("with") is None
+        assert store.get_all_with_proposals() == {}
+
+    def test_update_keeps_concurrent_writes(self):
+        """A session written by another worker mid-update is re-read, not overwritten."""
+        client = FakeMemcacheClient()
+        store = MemcachedSessionStore(client=client)
+        store.set("s1", _session(with_proposal=False))
+        other_worker = MemcachedSessionStore(client=client)
+        calls = []
+
+        def apply(data):
+            calls.append(len(data.history))
+            if len(calls) == 1:
+                turn = other_worker.get("s1")
+                turn.history.append({"role": "assistant", "content": "Which region?"})
+                other_worker.set("s1", turn)
+            data.pricing_task_status = "complete"
+
+        store.update("s1", apply)
+
+        loaded = store.get("s1")
+        assert calls == [1, 2]
+        assert len(loaded.history) == 2
+        assert loaded.pricing_task_status == "complete"
+        assert store.update("missing", apply) is None
+
+
+class TestCreateSessionStore:
+    """Tests for session store selection."""
+
+    def test_defaults_to_in_memory(self):
+        """Without Memcached servers configured, sessions stay in process."""
+        with patch.dict("os.environ", {"MEMCACHED_SERVERS": ""}):
+            assert isinstance(create_session_store(), InMemorySessionStore)
+
+    def test_uses_memcached_when_configured(self):
+        """Configured servers select the Memcached store."""
+        with patch.dict("os.environ", {"MEMCACHED_SERVERS": "cache-a:11211, cache-b:11211"}):
+            with patch("src.core.session.MemcachedSessionStore") as mock_store:
+                store = create_session_store()
+
+        mock_store.assert_called_once_with(["cache-a:11211", "cache-b:11211"])
+        assert store is mock_store.return_value
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
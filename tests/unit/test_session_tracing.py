@@ -0,0 +1,116 @@
+"""Tests for web session span tracking."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+
+from src.web import session_tracing
+from src.shared.async_utils import run_coroutine
+from src.web.session_tracing import (
+    end_session_span,
+    get_or_create_session_span,
+    session_scope,
+)
+
+
+@pytest.fixture(autouse=True)
+def recording_tracer(monkeypatch):
+    """Create real, distinct spans regardless of the global tracer provider."""
+    provider = TracerProvider()
+    monkeypatch.setattr(
+        session_tracing, "get_tracer", lambda **kwargs: provider.get_tracer("test")
+    )
+
+
+class TestSessionSpans:
+    """Tests for striped session span storage."""
+
+    def test_concurrent_requests_share_one_span_per_session(self):
+        """Concurrent lookups for the same session create exactly one span."""
+        session_ids = [f"span-session-{i % 8}" for i in range(64)]
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            spans = list(pool.map(get_or_create_session_span, session_ids))
+
+        for session_id, span in zip(session_ids, spans):
+            assert span is get_or_create_session_span(session_id)
+        assert len({id(span) for span in spans}) == 8
+
+        for i in range(8):
+            end_session_span(f"span-session-{i}")
+
+    def test_end_session_span_removes_span(self):
+        """Ending a session drops it from its shard and is safe to repeat."""
+        first = get_or_create_session_span("span-session-end")
+
+        end_session_span("span-session-end")
+        end_session_span("span-session-end")
+
+        index = session_tracing._shard("span-session-end")
+        assert "span-session-end" not in session_tracing._MAPS[index]
+        assert get_or_create_session_span("span-session-end") is not first
+        end_session_span("span-session-end")
+
+
+    def test_expired_span_is_ended_and_replaced(self):
+        """Spans older than the TTL are ended and a fresh span is started."""
+        first = get_or_create_session_span("span-session-ttl")
+        index = session_tracing._shard("span-session-ttl")
+        session_tracing._MAPS[index]["span-session-ttl"].created_at -= session_tracing._TTL_SECONDS + 1
+
+        second = get_or_create_session_span("span-session-ttl")
+
+        assert second is not first
+        assert not first.is_recording()
+        end_session_span("span-session-ttl")
+
+    def test_shard_capacity_evicts_least_recently_used(self, monkeypatch):
+        """A full shard evicts and ends its least recently used span."""
+        monkeypatch.setattr(session_tracing, "_MAX_SESSIONS_PER_SHARD", 2)
+        monkeypatch.setattr(session_tracing, "_shard", lambda session_id: 0)
+
+        oldest = get_or_create_session_span("span-lru-a")
+        get_or_create_session_span("span-lru-b")
+        get_or_create_session_span("span-lru-a")  # Refresh a, so b is now oldest
+        get_or_create_session_span("span-lru-c")
+
+        assert list(session_tracing._MAPS[0]) == ["span-lru-a", "span-lru-c"]
+        assert get_or_create_session_span("span-lru-a") is oldest
+
+        for session_id in ("span-lru-a", "span-lru-c"):
+            end_session_span(session_id)
+
+
+
+class TestSessionScope:
+    """Tests for the per-request session scope."""
+
+    def test_scope_activates_span(self):
+        """The session span is current inside the scope, including in run_coroutine."""
+        from opentelemetry import trace
+
+        async def inner():
+            return trace.get_current_span()
+
+        with session_scope("scope-session") as span:
+            assert span is get_or_create_session_span("scope-session")
+            assert run_coroutine(inner()) is span
+
+        assert trace.get_current_span() is not span
+        end_session_span("scope-session")
+
+    def test_scope_resets_on_error(self):
+        """An exception inside the scope still deactivates the session span."""
+        from opentelemetry import trace
+
+        with pytest.raises(ValueError):
+            with session_scope("scope-error") as span:
+                raise ValueError("boom")
+
+        assert trace.get_current_span() is not span
+        end_session_span("scope-error")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,158 @@
+"""Tests for the shared WorkflowHandler."""
+
+import asyncio
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core.models import SessionData
+from src.core.session import InMemorySessionStore
+from src.interfaces.handlers import WorkflowHandler
+from src.shared.errors import WorkflowError
+
+
+def _context():
+    context = MagicMock()
+    context.validate.return_value = True
+    return context
+
+
+class TestChatTurnCoalescing:
+    """Tests for coalescing duplicate in-flight chat turns."""
+
+    @pytest.mark.asyncio
+    async def test_duplicate_turns_share_one_agent_call(self):
+        """Concurrent identical turns should trigger a single agent call."""
+        handler = WorkflowHandler()
+        calls = []
+        release = asyncio.Event()
+
+        async def fake_turn(client, store, session_id, message):
+            calls.append(message)
+            await release.wait()
+            return {"response": "Which region?", "is_done": False}, None
+
+        with patch("src.interfaces.handlers.run_question_turn_with_session", fake_turn):
+            first = asyncio.create_task(handler.handle_chat_turn(_context(), "s1", "Hi"))
+            second = asyncio.create_task(handler.handle_chat_turn(_context(), "s1", "Hi"))
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(first, second)
+
+        assert calls == ["Hi"]
+        assert results[0] == results[1] == {"response": "Which region?", "is_done": False}
+        assert results[0] is not results[1]
+        assert handler._inflight_turns == {}
+
+    @pytest.mark.asyncio
+    async def test_different_messages_are_not_coalesced(self):
+        """Distinct turns for a session should each reach the agent."""
+        handler = WorkflowHandler()
+        calls = []
+
+        async def fake_turn(client, store, session_id, message):
+            calls.append(message)
+            return {"response": message, "is_done": False}, None
+
+        with patch("src.interfaces.handlers.run_question_turn_with_session", fake_turn):
+            await asyncio.gather(
+                handler.handle_chat_turn(_context(), "s1", "A"),
+                handler.handle_chat_turn(_context(), "s1", "B"),
+            )
+
+        assert sorted(calls) == ["A", "B"]
+
+    def test_coalesces_across_event_loops(self):
+        """Duplicates issued from separate threads and loops should share a call."""
+        handler = WorkflowHandler()
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        async def fake_turn(client, store, session_id, message):
+            calls.append(message)
+            started.set()
+            await asyncio.get_running_loop().run_in_executor(None, release.wait)
+            return {"response": "ok", "is_done": False}, None
+
+        results = []
+
+        def worker():
+            results.append(asyncio.run(handler.handle_chat_turn(_context(), "s1", "Hi")))
+
+        with patch("src.interfaces.handlers.run_question_turn_with_session", fake_turn):
+            leader = threading.Thread(target=worker)
+            leader.start()
+            started.wait(timeout=5)
+            follower = threading.Thread(target=worker)
+            follower.start()
+            follower.join(timeout=0.2)
+            release.set()
+            leader.join(timeout=5)
+            follower.join(timeout=5)
+
+        assert calls == ["Hi"]
+        assert results == [{"response": "ok", "is_done": False}] * 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_follower_does_not_break_leader(self):
+        """Cancelling a coalesced waiter should leave the leader's turn intact."""
+        handler = WorkflowHandler()
+        release = asyncio.Event()
+
+        async def fake_turn(client, store, session_id, message):
+            await release.wait()
+            return {"response": "ok", "is_done": False}, None
+
+        with patch("src.interfaces.handlers.run_question_turn_with_session", fake_turn):
+            leader = asyncio.create_task(handler.handle_chat_turn(_context(), "s1", "Hi"))
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(handler.handle_chat_turn(_context(), "s1", "Hi"))
+            await asyncio.sleep(0)
+            follower.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await follower
+            release.set()
+            result = await leader
+
+        assert result == {"response": "ok", "is_done": False}
+        assert handler._inflight_turns == {}
+
+    @pytest.mark.asyncio
+    async def test_exception_is_shared_and_registry_cleared(self):
+        """A failing turn should propagate to waiters and allow a retry."""
+        handler = WorkflowHandler()
+        release = asyncio.Event()
+
+        async def fake_turn(client, store, session_id, message):
+            await release.wait()
+            raise WorkflowError("agent unavailable")
+
+        with patch("src.interfaces.handlers.run_question_turn_with_session", fake_turn):
+            leader = asyncio.create_task(handler.handle_chat_turn(_context(), "s1", "Hi"))
+            await asyncio.sleep(0)
+            follower = asyncio.create_task(handler.handle_chat_turn(_context(), "s1", "Hi"))
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(leader, follower, return_exceptions=True)
+
+        assert [str(r) for r in results] == ["agent unavailable"] * 2
+        assert all(isinstance(r, WorkflowError) for r in results)
+        assert handler._inflight_turns == {}
+
+
+class TestSessionHistory:
+    """Tests for session history lookups."""
+
+    def test_history_list_matches_dict_form(self):
+        """The list accessor returns the same history the dict form wraps."""
+        handler = WorkflowHandler()
+        context = _context()
+        context.session_store = InMemorySessionStore()
+        history = [{"role": "user", "content": "Hi"}]
+        context.session_store.set("s1", SessionData(thread=None, history=history))
+
+        assert handler.get_session_history_list(context, "s1") is history
+        assert handler.get_session_history(context, "s1") == {"history": history}
+        assert handler.get_session_history_list(context, "missing") == []